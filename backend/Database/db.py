@@ -1,9 +1,16 @@
 # File: /SIGMA/backend/Database/db.py
 
+import logging
 import os
+import threading
+from contextlib import contextmanager
+
 import psycopg2
+import psycopg2.pool
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables from .env file
 dotenv_path = os.path.join(os.path.dirname(__file__), ".env")
 load_dotenv(dotenv_path)
@@ -15,17 +22,50 @@ DB_USER = os.getenv("PGUSER")
 DB_PASS = os.getenv("PGPASSWORD")
 DB_PORT = os.getenv("PGPORT")
 
+# Connection pool, created lazily so importing this module never touches the DB
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool():
+    """
+    Returns the shared connection pool, creating it on first use.
+    """
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                try:
+                    _POOL = psycopg2.pool.ThreadedConnectionPool(
+                        minconn=2,
+                        maxconn=16,
+                        host=DB_HOST,
+                        dbname=DB_NAME,
+                        user=DB_USER,
+                        password=DB_PASS,
+                        port=DB_PORT,
+                    )
+                    logger.debug("Database connection pool created.")
+                except Exception:
+                    logger.exception("Database connection failed")
+                    raise
+    return _POOL
 
+
+@contextmanager
 def get_connection():
     """
-    Creates and returns a connection object to the PostgreSQL database.
+    Yields a pooled connection to the PostgreSQL database.
+
+    The connection is returned to the pool on exit; connections that
+    raised an error are discarded instead of being recycled.
     """
+    pool = _get_pool()
+    conn = pool.getconn()
     try:
-        conn = psycopg2.connect(
-            host=DB_HOST, dbname=DB_NAME, user=DB_USER, password=DB_PASS, port=DB_PORT
-        )
-        print("[✅] Database connection successful.")
-        return conn
-    except Exception as e:
-        print(f"[❌] Database connection failed: {e}")
+        yield conn
+    except Exception:
+        pool.putconn(conn, close=True)
         raise
+    else:
+        pool.putconn(conn)
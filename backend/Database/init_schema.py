@@ -7,9 +7,6 @@ def create_tables():
     """
     Create database tables required for the SIGMA project.
     """
-    connection = get_connection()
-    cursor = connection.cursor()
-
     create_query = """
     CREATE TABLE IF NOT EXISTS missions (
         id SERIAL PRIMARY KEY,
@@ -20,16 +17,17 @@ def create_tables():
     );
     """
 
-    try:
-        cursor.execute(create_query)
-        connection.commit()
-        print("[✅] Table 'missions' created or already exists.")
-    except Exception as e:
-        print(f"[❌] Failed to create table: {e}")
-        connection.rollback()
-    finally:
-        cursor.close()
-        connection.close()
+    with get_connection() as connection:
+        cursor = connection.cursor()
+        try:
+            cursor.execute(create_query)
+            connection.commit()
+            print("[✅] Table 'missions' created or already exists.")
+        except Exception as e:
+            print(f"[❌] Failed to create table: {e}")
+            connection.rollback()
+        finally:
+            cursor.close()
 
 
 if __name__ == "__main__":
@@ -1,59 +1,122 @@
 # File: /SIGMA/backend/Database/mission_store.py
 
+import logging
+import time
+
 from .db import get_connection
-from datetime import datetime
+
+import psycopg2.errors
+from psycopg2.extras import execute_values
+
+logger = logging.getLogger(__name__)
+
+# Prepared once per pooled connection so Postgres skips parse/plan on
+# every subsequent single-row insert
+_PREPARE_INSERT = """
+PREPARE insert_mission_stmt (text, text, bool) AS
+INSERT INTO missions (name, difficulty, is_active)
+VALUES ($1, $2, $3)
+RETURNING id;
+"""
+_EXECUTE_INSERT = "EXECUTE insert_mission_stmt (%s, %s, %s);"
+
+# In-process cache for fetch_all_missions; mission data changes rarely
+_CACHE_TTL = 30  # seconds
+_cache = {"ts": 0.0, "data": None}
+
+
+def insert_missions_bulk(rows: list[tuple[str, str, bool]]):
+    """
+    Inserts multiple missions into the 'missions' table in one statement.
+
+    Args:
+        rows (list[tuple]): (name, difficulty, is_active) tuples.
+
+    Returns:
+        list[int]: The IDs of the inserted missions.
+    """
+    insert_query = """
+    INSERT INTO missions (name, difficulty, is_active)
+    VALUES %s
+    RETURNING id;
+    """
+    with get_connection() as connection:
+        cursor = connection.cursor()
+        try:
+            execute_values(cursor, insert_query, rows, page_size=500)
+            mission_ids = [row[0] for row in cursor.fetchall()]
+            connection.commit()
+            _cache["ts"] = 0  # new rows invalidate the fetch cache
+            logger.debug("Inserted %d mission(s).", len(mission_ids))
+            return mission_ids
+        except Exception:
+            logger.exception("Failed to insert missions")
+            connection.rollback()
+            return []
+        finally:
+            cursor.close()
 
 
 def insert_mission(name: str, difficulty: str = "medium", is_active: bool = True):
     """
     Inserts a new mission into the 'missions' table.
 
+    Uses a server-side prepared statement, created on first use per
+    pooled connection, so repeated inserts skip the parse/plan step.
+
     Args:
         name (str): The name/title of the mission.
         difficulty (str): Difficulty level, e.g., 'easy', 'medium', 'hard'.
         is_active (bool): Whether the mission is currently active.
     """
-    connection = get_connection()
-    cursor = connection.cursor()
+    params = (name, difficulty, is_active)
+    with get_connection() as connection:
+        cursor = connection.cursor()
+        try:
+            try:
+                cursor.execute(_EXECUTE_INSERT, params)
+            except psycopg2.errors.InvalidSqlStatementName:
+                # First insert on this connection: prepare, then retry
+                connection.rollback()
+                cursor.execute(_PREPARE_INSERT)
+                cursor.execute(_EXECUTE_INSERT, params)
+            mission_id = cursor.fetchone()[0]
+            connection.commit()
+            _cache["ts"] = 0  # new row invalidates the fetch cache
+            logger.debug("Mission '%s' inserted with ID: %s", name, mission_id)
+            return mission_id
+        except Exception:
+            logger.exception("Failed to insert mission")
+            connection.rollback()
+        finally:
+            cursor.close()
 
-    insert_query = """
-    INSERT INTO missions (name, difficulty, is_active, created_at)
-    VALUES (%s, %s, %s, %s)
-    RETURNING id;
-    """
-    try:
-        created_at = datetime.now()
-        cursor.execute(insert_query, (name, difficulty, is_active, created_at))
-        mission_id = cursor.fetchone()[0]
-        connection.commit()
-        print(f"[✅] Mission '{name}' inserted with ID: {mission_id}")
-        return mission_id
-    except Exception as e:
-        print(f"[❌] Failed to insert mission: {e}")
-        connection.rollback()
-    finally:
-        cursor.close()
-        connection.close()
-
-
-def fetch_all_missions():
+
+def fetch_missions_page(limit: int = 32, offset: int = 0):
     """
-    Retrieves all missions from the 'missions' table.
+    Retrieves a single page of missions from the 'missions' table.
+
+    Lets callers that only show a screenful at a time (e.g. the menu)
+    load on demand instead of materializing the whole table up front.
+
+    Args:
+        limit (int): Maximum number of missions to return.
+        offset (int): Number of missions to skip, in id order.
 
     Returns:
         list[dict]: A list of missions as dictionaries.
     """
-    connection = get_connection()
-    cursor = connection.cursor()
-
-    fetch_query = "SELECT id, name, difficulty, is_active, created_at FROM missions ORDER BY id ASC;"
+    fetch_query = """
+    SELECT id, name, difficulty, is_active, created_at
+    FROM missions ORDER BY id ASC
+    LIMIT %s OFFSET %s;
+    """
 
-    try:
-        cursor.execute(fetch_query)
-        rows = cursor.fetchall()
-        missions = []
-        for row in rows:
-            missions.append(
+    with get_connection() as connection:
+        cursor = connection.cursor()
+        try:
+            cursor.execute(fetch_query, (limit, offset))
+            missions = [
                 {
                     "id": row[0],
                     "name": row[1],
@@ -61,12 +124,60 @@ def fetch_all_missions():
                     "is_active": row[3],
                     "created_at": row[4].strftime("%Y-%m-%d %H:%M:%S"),
                 }
-            )
-        print(f"[✅] Retrieved {len(missions)} mission(s).")
-        return missions
-    except Exception as e:
-        print(f"[❌] Failed to fetch missions: {e}")
-        return []
-    finally:
-        cursor.close()
-        connection.close()
+                for row in cursor.fetchall()
+            ]
+            logger.debug("Retrieved %d mission(s) (offset %d).", len(missions), offset)
+            return missions
+        except Exception:
+            logger.exception("Failed to fetch mission page")
+            return []
+        finally:
+            cursor.close()
+
+
+def fetch_all_missions(force: bool = False):
+    """
+    Retrieves all missions from the 'missions' table.
+
+    Results are cached in-process for a short TTL so repeated calls
+    (e.g. menu refreshes) skip the database round-trip.
+
+    Args:
+        force (bool): Bypass the cache and hit the database.
+
+    Returns:
+        list[dict]: A list of missions as dictionaries.
+    """
+    if not force and _cache["data"] is not None:
+        if time.monotonic() - _cache["ts"] < _CACHE_TTL:
+            return _cache["data"]
+
+    fetch_query = "SELECT id, name, difficulty, is_active, created_at FROM missions ORDER BY id ASC;"
+
+    with get_connection() as connection:
+        # Named (server-side) cursor streams rows in batches instead of
+        # materializing the whole result set client-side up front
+        cursor = connection.cursor(name="fetch_missions_ss")
+        cursor.itersize = 1000
+        try:
+            cursor.execute(fetch_query)
+            missions = []
+            for row in cursor:
+                missions.append(
+                    {
+                        "id": row[0],
+                        "name": row[1],
+                        "difficulty": row[2],
+                        "is_active": row[3],
+                        "created_at": row[4].strftime("%Y-%m-%d %H:%M:%S"),
+                    }
+                )
+            _cache["data"] = missions
+            _cache["ts"] = time.monotonic()
+            logger.debug("Retrieved %d mission(s).", len(missions))
+            return missions
+        except Exception:
+            logger.exception("Failed to fetch missions")
+            return []
+        finally:
+            cursor.close()
@@ -1,12 +1,16 @@
 # File: /SIGMA/backend/Database/test_runner.py
 
-from mission_store import insert_mission, fetch_all_missions
+from mission_store import insert_missions_bulk, fetch_all_missions
 
 if __name__ == "__main__":
-    # Test insert
-    insert_mission("Trace Echo", difficulty="medium", is_active=True)
-    insert_mission("Core Breach", difficulty="hard", is_active=False)
-    insert_mission("Firewall Reboot", difficulty="easy", is_active=True)
+    # Test insert (one batched statement instead of one round-trip per row)
+    insert_missions_bulk(
+        [
+            ("Trace Echo", "medium", True),
+            ("Core Breach", "hard", False),
+            ("Firewall Reboot", "easy", True),
+        ]
+    )
 
     # Test fetch
     all_missions = fetch_all_missions()
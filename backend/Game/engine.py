@@ -1,6 +1,8 @@
 import pygame
+import pygame.freetype
 import sys
 import random
+import numpy
 from Database.mission_store import fetch_all_missions
 
 
@@ -13,31 +15,43 @@ class MatrixRain:
         self.height = height
         self.font = font
 
-        self.font_width, self.font_height = self.font.size("A")
+        self.font_width, self.font_height = self.font.get_rect("A").size
         self.columns = self.width // self.font_width
-        self.drops = [random.randint(-20, 0) for _ in range(self.columns)]
+        self.drops = numpy.random.randint(-20, 1, size=self.columns, dtype=numpy.int32)
         self.chars = ["0", "1"]
+        self._chars_arr = numpy.array(self.chars)
+        # Render each glyph once; the draw loop only blits cached surfaces
+        self._glyphs = {
+            c: self.font.render(c, (0, 255, 0))[0].convert_alpha()
+            for c in self.chars
+        }
+
+        # Persistent fade overlay; allocating one per frame is pure churn
+        self._overlay = pygame.Surface((self.width, self.height)).convert()
+        self._overlay.set_alpha(60)
+        self._overlay.fill((0, 0, 0))
 
     def draw(self):
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(60)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-
-        for i in range(self.columns):
-            char = random.choice(self.chars)
-            x = i * self.font_width
-            y = self.drops[i] * self.font_height
-
-            char_surface = self.font.render(char, True, (0, 255, 0))
-            self.screen.blit(char_surface, (x, y))
+        self.screen.blit(self._overlay, (0, 0))
+
+        chars = numpy.random.choice(self._chars_arr, self.columns)
+        ys = self.drops * self.font_height
+        # One batched blits() call keeps the per-glyph loop on the C side
+        self.screen.blits(
+            [
+                (self._glyphs[chars[i]], (i * self.font_width, ys[i]))
+                for i in range(self.columns)
+            ],
+            doreturn=False,
+        )
 
-            self.drops[i] += 1
-            if (
-                self.drops[i] * self.font_height > self.height
-                and random.random() > 0.975
-            ):
-                self.drops[i] = random.randint(-20, 0)
+        # Advance and recycle all drops in vectorized statements
+        self.drops += 1
+        off_screen = self.drops * self.font_height > self.height
+        reset = off_screen & (numpy.random.random(self.columns) > 0.975)
+        n_reset = int(reset.sum())
+        if n_reset:
+            self.drops[reset] = numpy.random.randint(-20, 1, n_reset)
 
 
 class GameEngine:
@@ -45,7 +59,7 @@ class GameEngine:
 
     def __init__(self, width=800, height=600):
         pygame.init()
-        pygame.font.init()
+        pygame.freetype.init()
 
         self.width = width
         self.height = height
@@ -55,20 +69,45 @@ class GameEngine:
         self.clock = pygame.time.Clock()
         self.running = True
 
-        self.font = pygame.font.SysFont("Courier New", 20)
-        self.big_font = pygame.font.SysFont("Courier New", 36)
+        # freetype rasterizes small repeated glyphs noticeably faster than
+        # pygame.font and can render straight into an existing surface
+        self.font = pygame.freetype.SysFont("Courier New", 20)
+        self.big_font = pygame.freetype.SysFont("Courier New", 36)
 
         self.missions = fetch_all_missions()
         self.selected_index = 0
 
+        # Pre-render mission rows once (normal, selected) so the menu loop
+        # only blits instead of re-rasterizing text at 60 FPS
+        self._mission_surfaces = []
+        for mission in self.missions:
+            text = f"[{mission['difficulty'].upper()}] {mission['name']}"
+            self._mission_surfaces.append(
+                (
+                    self.font.render(text, (0, 150, 150))[0].convert_alpha(),
+                    self.font.render(text, (0, 255, 255))[0].convert_alpha(),
+                )
+            )
+
         self.state = "menu"  # 'menu', 'loading', 'gameplay', 'result'
-        self.loading_counter = 0
+        self._loading_start_ms = 0
+        self.loading_duration_ms = 3000
+
+        # The loading text only has four dot states; render them up front
+        self._loading_surfaces = [
+            self.font.render("LOADING MISSION" + "." * dots, (0, 255, 0))[0].convert_alpha()
+            for dots in range(4)
+        ]
         self.matrix_rain = MatrixRain(self.screen, self.width, self.height, self.font)
 
         self.mission_timer = 0
         self.mission_duration = 300  # 5 seconds (60 FPS)
         self.mission_outcome = None  # "success" or "failure"
 
+        # Signature of what was last drawn; static states (menu/result)
+        # skip the redraw + flip entirely while it is unchanged
+        self._last_drawn = None
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -88,7 +127,7 @@ class GameEngine:
                         )
                     elif event.key == pygame.K_RETURN:
                         self.state = "loading"
-                        self.loading_counter = 0
+                        self._loading_start_ms = pygame.time.get_ticks()
 
                 elif self.state == "result":
                     if event.key in [pygame.K_RETURN, pygame.K_ESCAPE]:
@@ -96,8 +135,8 @@ class GameEngine:
 
     def update(self):
         if self.state == "loading":
-            self.loading_counter += 1
-            if self.loading_counter > 180:
+            elapsed = pygame.time.get_ticks() - self._loading_start_ms
+            if elapsed > self.loading_duration_ms:
                 self.state = "gameplay"
                 self.mission_timer = 0
                 self.mission_outcome = None
@@ -110,36 +149,34 @@ class GameEngine:
 
     def draw_menu(self):
         self.screen.fill((0, 0, 0))
-        header = self.font.render(
-            "Available Missions (Use ↑ ↓, Enter to load)", True, (0, 255, 0)
+        self.font.render_to(
+            self.screen, (20, 10), "Available Missions (Use ↑ ↓, Enter to load)", (0, 255, 0)
         )
-        self.screen.blit(header, (20, 10))
 
-        y = 60
-        for i, mission in enumerate(self.missions):
-            text = f"[{mission['difficulty'].upper()}] {mission['name']}"
-            if i == self.selected_index:
-                pygame.draw.rect(
-                    self.screen, (0, 100, 100), pygame.Rect(15, y - 5, 770, 28)
-                )
-                color = (0, 255, 255)
-            else:
-                color = (0, 150, 150)
-            text_surf = self.font.render(text, True, color)
-            self.screen.blit(text_surf, (20, y))
-            y += 30
+        # Highlight first, then one batched blits() call for every row
+        highlight_y = 60 + self.selected_index * 30
+        pygame.draw.rect(
+            self.screen, (0, 100, 100), pygame.Rect(15, highlight_y - 5, 770, 28)
+        )
+        self.screen.blits(
+            [
+                (surfs[1] if i == self.selected_index else surfs[0], (20, 60 + i * 30))
+                for i, surfs in enumerate(self._mission_surfaces)
+            ],
+            doreturn=False,
+        )
 
     def draw_loading_screen(self):
         self.matrix_rain.draw()
-        dots = (self.loading_counter // 15) % 4
-        loading_text = "LOADING MISSION" + ("." * dots)
-        text_surf = self.font.render(loading_text, True, (0, 255, 0))
+        elapsed = pygame.time.get_ticks() - self._loading_start_ms
+        dots = (elapsed // 250) % 4
+        text_surf = self._loading_surfaces[dots]
         rect = text_surf.get_rect(center=(self.width // 2, self.height // 2))
         self.screen.blit(text_surf, rect)
 
     def draw_gameplay_screen(self):
         self.screen.fill((0, 0, 0))
-        title = self.big_font.render("HACKING IN PROGRESS...", True, (0, 255, 0))
+        title, _ = self.big_font.render("HACKING IN PROGRESS...", (0, 255, 0))
         bar_width = int((self.mission_timer / self.mission_duration) * 600)
         bar_rect = pygame.Rect(100, 300, bar_width, 20)
         pygame.draw.rect(self.screen, (0, 255, 0), bar_rect)
@@ -153,18 +190,41 @@ class GameEngine:
             else "MISSION FAILED"
         )
         color = (0, 255, 0) if self.mission_outcome == "success" else (255, 0, 0)
-        result_surface = self.big_font.render(result_text, True, color)
+        result_surface, _ = self.big_font.render(result_text, color)
         self.screen.blit(
             result_surface,
             result_surface.get_rect(center=(self.width // 2, self.height // 2 - 20)),
         )
 
-        prompt = self.font.render("Press ENTER to return to menu", True, (0, 150, 150))
+        prompt, _ = self.font.render("Press ENTER to return to menu", (0, 150, 150))
         self.screen.blit(
             prompt, prompt.get_rect(center=(self.width // 2, self.height // 2 + 40))
         )
 
     def draw(self):
+        # Loading and gameplay animate every frame; menu and result only
+        # change on input, so their frames are skipped while identical
+        signature = (self.state, self.selected_index, self.mission_outcome)
+        if self.state in ("menu", "result") and signature == self._last_drawn:
+            return
+
+        # Mid-gameplay only the progress bar moves: black out and redraw
+        # just that strip and push it with a targeted display.update
+        if (
+            self.state == "gameplay"
+            and self._last_drawn is not None
+            and self._last_drawn[0] == "gameplay"
+        ):
+            self._last_drawn = signature
+            bar_area = pygame.Rect(100, 300, 600, 20)
+            self.screen.fill((0, 0, 0), bar_area)
+            bar_width = int((self.mission_timer / self.mission_duration) * 600)
+            pygame.draw.rect(self.screen, (0, 255, 0), pygame.Rect(100, 300, bar_width, 20))
+            pygame.display.update(bar_area)
+            return
+
+        self._last_drawn = signature
+
         if self.state == "menu":
             self.draw_menu()
         elif self.state == "loading":
@@ -174,6 +234,7 @@ class GameEngine:
         elif self.state == "result":
             self.draw_result_screen()
 
+        # Full flips are reserved for state transitions and animated frames
         pygame.display.flip()
 
     def run(self):
@@ -181,7 +242,12 @@ class GameEngine:
             self.handle_events()
             self.update()
             self.draw()
-            self.clock.tick(60)
+            # Animated states need the full 60 FPS; the static menu and
+            # result screens are happy at half that
+            if self.state in ("loading", "gameplay"):
+                self.clock.tick(60)
+            else:
+                self.clock.tick(30)
 
         pygame.quit()
         sys.exit()
@@ -1,7 +1,6 @@
 import pygame
-import math
 import random
-from typing import List, Dict, Callable, Any, Tuple
+import numpy
 
 class LoadingAnimation:
     def __init__(self, screen: pygame.Surface, width: int, height: int):
@@ -40,66 +39,76 @@ class HackingAnimation(LoadingAnimation):
         super().__init__(screen, width, height)
         self.duration = 3500
         self.chars = "01"
-        self.streams: List[Dict] = []
+        self._chars_arr = numpy.array(list(self.chars))
         self.font = pygame.font.SysFont("Courier New", 18, bold=True)
+        # Pre-render every (char, brightness bucket) glyph so draw() never
+        # calls font.render; brightness is quantized to 5-step buckets
+        self._glyph_cache = {
+            (c, b): self.font.render(c, True, (0, min(255, b + 100), 0)).convert_alpha()
+            for c in self.chars
+            for b in range(50, 256, 5)
+        }
+        # Persistent overlay; a fresh full-screen SRCALPHA alloc per frame
+        # is pure memory churn
+        self._overlay = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        self._overlay.fill((0, 0, 0, 200))
         self.setup_streams()
-    
+
     def setup_streams(self):
-        """Initialize the binary rain streams"""
-        stream_count = self.width // 20  # One stream every 20 pixels
-        for i in range(stream_count):
-            x = random.randint(0, self.width)
-            speed = random.uniform(2, 5)
-            length = random.randint(5, 15)
-            self.streams.append({
-                'x': x,
-                'y': random.randint(-100, 0),
-                'speed': speed,
-                'chars': [random.choice(self.chars) for _ in range(length)],
-                'brightness': [255] * length
-            })
-    
+        """Initialize the binary rain streams as structure-of-arrays"""
+        n = self.width // 20  # One stream every 20 pixels
+        self.stream_count = n
+        self.sx = numpy.random.randint(0, self.width + 1, n)
+        self.sy = numpy.random.randint(-100, 1, n).astype(numpy.float64)
+        self.sspeed = numpy.random.uniform(2, 5, n)
+        self.slen = numpy.random.randint(5, 16, n)
+        max_len = int(self.slen.max())
+        self.schars = numpy.random.choice(self._chars_arr, (n, max_len))
+        # Brightness decays head-to-tail by a fixed 30 per cell, floored at
+        # 50 — a constant ramp, so compute it once up front
+        self.sbri = numpy.empty((n, max_len), numpy.int16)
+        self.sbri[:, 0] = 255
+        for j in range(1, max_len):
+            self.sbri[:, j] = numpy.maximum(50, self.sbri[:, j - 1] - 30)
+        # Quantize to the glyph cache's 5-step buckets once, vectorized,
+        # instead of per cell in the draw loop
+        self.sbucket = numpy.minimum(255, numpy.maximum(50, self.sbri // 5 * 5))
+
     def update(self) -> bool:
         super().update()
-        
-        # Update stream positions
-        for stream in self.streams:
-            stream['y'] += stream['speed']
-            
-            # Reset stream if it goes off screen
-            if stream['y'] > self.height + len(stream['chars']) * 20:
-                stream['y'] = -len(stream['chars']) * 20
-                stream['x'] = random.randint(0, self.width)
-                
-            # Update brightness
-            for i in range(len(stream['brightness'])):
-                if i == 0:
-                    stream['brightness'][i] = 255
-                else:
-                    stream['brightness'][i] = max(50, stream['brightness'][i-1] - 30)
-        
-        # Randomly change some characters
-        for stream in self.streams:
-            if random.random() < 0.1:  # 10% chance to change a character
-                idx = random.randint(0, len(stream['chars']) - 1)
-                stream['chars'][idx] = random.choice(self.chars)
-        
+
+        # Advance all streams and recycle the off-screen ones in a few
+        # vectorized statements
+        self.sy += self.sspeed
+        off = self.sy > self.height + self.slen * 20
+        n_off = int(off.sum())
+        if n_off:
+            self.sy[off] = -self.slen[off] * 20
+            self.sx[off] = numpy.random.randint(0, self.width + 1, n_off)
+
+        # Randomly change some characters (10% of streams per frame)
+        mutate = numpy.random.random(self.stream_count) < 0.1
+        n_mutate = int(mutate.sum())
+        if n_mutate:
+            rows = numpy.nonzero(mutate)[0]
+            cols = (numpy.random.random(n_mutate) * self.slen[rows]).astype(int)
+            self.schars[rows, cols] = numpy.random.choice(self._chars_arr, n_mutate)
+
         return self.complete
     
     def draw(self):
         # Draw a semi-transparent black overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay, (0, 0))
         
         # Draw the binary rain
-        for stream in self.streams:
-            for i, (char, brightness) in enumerate(zip(stream['chars'], stream['brightness'])):
-                y_pos = stream['y'] + i * 20
+        for i in range(self.stream_count):
+            x = self.sx[i]
+            base_y = self.sy[i]
+            for j in range(self.slen[i]):
+                y_pos = base_y + j * 20
                 if 0 <= y_pos < self.height:
-                    color = (0, min(255, brightness + 100), 0)
-                    text = self.font.render(char, True, color)
-                    self.screen.blit(text, (stream['x'], y_pos))
+                    text = self._glyph_cache[(self.schars[i, j], self.sbucket[i, j])]
+                    self.screen.blit(text, (x, y_pos))
         
         # Draw progress bar
         bar_width = self.width - 100
@@ -139,6 +148,9 @@ class DownloadAnimation(LoadingAnimation):
         self.current_file = 0
         self.file_progress = 0.0
         self.last_update = 0
+        # Persistent background overlay, allocated once instead of per frame
+        self._overlay = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        self._overlay.fill((0, 0, 50, 220))  # Dark blue background
     
     def update(self) -> bool:
         super().update()
@@ -156,9 +168,7 @@ class DownloadAnimation(LoadingAnimation):
     
     def draw(self):
         # Background
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 50, 220))  # Dark blue background
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay, (0, 0))
         
         # Title
         title = self.font.render("SECURE DOWNLOAD IN PROGRESS", True, (100, 200, 255))
@@ -1,9 +1,7 @@
 import pygame
 import sys
-import random
-import math
 import numpy
-import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 import sys
 import os
@@ -33,6 +31,11 @@ class GameEngine:
         self.running = True
         self.state = "menu"  # 'menu', 'loading', 'game'
 
+        # The game is keyboard-only; block everything else at the SDL
+        # layer so mouse motion never floods the event queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
         # Initialize sound system and start playing hacking music
         self.sound_manager = SoundManager()
         # Start playing hacking music when the game starts
@@ -59,6 +62,90 @@ class GameEngine:
         self.missions = fetch_all_missions()
         self.selected_index = 0
 
+        # Mission rows are static text; rasterize them once (including the
+        # width-based truncation) instead of per frame in draw_mission_list
+        self.mission_font = pygame.font.SysFont("Courier New", 20, bold=True)
+        self._mission_name_surfs = self._build_mission_name_surfs()
+
+        # Auxiliary fonts, built once; SysFont walks the system font list
+        # and opens a TTF on every call
+        self.controls_font = pygame.font.SysFont("Arial", 14)
+        self.confirm_font = pygame.font.SysFont("Courier New", 22, bold=True)
+
+        # There are only three difficulty badges and one selection prefix;
+        # render them once and look them up everywhere
+        self._diff_surfs = {
+            "EASY": self.mission_font.render("EASY", True, (100, 255, 100)).convert_alpha(),
+            "MEDIUM": self.mission_font.render("MEDIUM", True, (255, 200, 0)).convert_alpha(),
+            "HARD": self.mission_font.render("HARD", True, (255, 100, 100)).convert_alpha(),
+        }
+        self._prefix_surf = self.mission_font.render(">>", True, (0, 255, 100)).convert_alpha()
+
+        # Compose every mission row (name + difficulty) into one tall atlas
+        # surface; the menu loop blits the visible slice in a single call
+        self._mission_atlas = self._build_mission_atlas()
+
+        # Mission list container chrome is static; build it once
+        container_width = min(800, self.width - 100)
+        container_height = min(400, self.height - 250)
+        self._container_surf = pygame.Surface(
+            (container_width, container_height), pygame.SRCALPHA
+        )
+        self._container_surf.fill((0, 20, 10, 200))  # Semi-transparent dark green
+        pygame.draw.rect(
+            self._container_surf, (0, 120, 60, 200), self._container_surf.get_rect(), 2
+        )
+        self._container_surf = self._container_surf.convert_alpha()
+
+        # Selection highlight geometry is fixed; draw it once
+        highlight_width = min(800, self.width - 100) - 40
+        self._highlight_surf = pygame.Surface((highlight_width, 50), pygame.SRCALPHA)
+        pygame.draw.rect(
+            self._highlight_surf,
+            (0, 50, 25, 200),  # Darker green for selected
+            self._highlight_surf.get_rect(),
+            border_radius=4,
+        )
+        # Left accent bar
+        pygame.draw.rect(self._highlight_surf, (0, 255, 100), (0, 0, 4, 50))
+        self._highlight_surf = self._highlight_surf.convert_alpha()
+
+        # Per-character glyph cache for the type_text animation, shared
+        # across messages; pre-warmed with printable ASCII so the first
+        # message never stalls on rasterization
+        self._glyph_cache: Dict[str, pygame.Surface] = {
+            chr(c): self.font.render(chr(c), True, (0, 255, 0))
+            for c in range(32, 127)
+        }
+
+        # Bounded LRU cache of clean glitch_text base surfaces keyed by
+        # (text, color); only the glitch rectangles change per frame
+        self._text_cache: OrderedDict = OrderedDict()
+        self._text_cache_max = 256
+
+        # Fully composed menu frame, re-rendered only when the selection
+        # or the mission list changes
+        self._menu_bg_surface: Optional[pygame.Surface] = None
+        self._menu_bg_key: Optional[tuple] = None
+
+        # Active typing-animation state; advanced from run() each frame
+        self._typer: Optional[Dict[str, Any]] = None
+
+        # Reusable glitch scratch surfaces keyed by text size
+        self._glitch_scratch: Dict[tuple, pygame.Surface] = {}
+
+        # (surface, advance) per glyph for render_text_with_spacing,
+        # keyed by (char, color, font) so different fonts don't collide
+        self._spacing_glyph_cache: Dict[tuple, tuple] = {}
+
+        # Advance widths per (char, font), pre-warmed for the main font
+        # from one metrics() call instead of per-char size() round-trips
+        self._advance_cache: Dict[tuple, int] = {}
+        printable = [chr(c) for c in range(32, 127)]
+        for char, m in zip(printable, self.font.metrics("".join(printable))):
+            if m is not None:
+                self._advance_cache[(char, id(self.font))] = m[4]
+
         # Animation state
         self.loading_animation: Optional[LoadingAnimation] = None
         self.loading_start_time = 0
@@ -66,9 +153,71 @@ class GameEngine:
 
         # For glitch flicker effect timing
         self.flicker_timer = 0
+        # Menu redraws are gated: on input (dirty) or on the flicker beat
+        self._dirty = True
+        self._last_flicker_ms = 0
+
+        # Batched RNG plus a small pool of pre-filled glitch rectangles so
+        # glitch_text doesn't call random.randint / draw.rect per rect
+        self._rng = numpy.random.default_rng()
+        self._glitch_pool = []
+        for w, h in [(5, 1), (10, 2), (15, 3)]:
+            rect_surf = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+            rect_surf.fill((0, 255, 0, 140))
+            self._glitch_pool.append(rect_surf)
+
+        # The menu grid never changes; rasterize its lines once
+        self.grid_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        for x in range(0, self.width, 20):
+            pygame.draw.line(self.grid_overlay, (0, 20, 0, 255), (x, 0), (x, self.height))
+        for y in range(0, self.height, 20):
+            pygame.draw.line(self.grid_overlay, (0, 20, 0, 255), (0, y), (self.width, y))
+        self.grid_overlay = self.grid_overlay.convert_alpha()
+
+        # Opaque background with the scanlines baked in: one memcpy-class
+        # blit replaces fill() plus a full-screen per-pixel alpha overlay
+        self._bg = pygame.Surface((self.width, self.height)).convert()
+        self._bg.fill((0, 0, 0))
+        for y in range(0, self.height, 3):
+            pygame.draw.line(self._bg, (0, 40, 0), (0, y), (self.width, y))
+        # The static menu grid composites into the same baked background,
+        # so frame composition starts from finished chrome
+        self._bg.blit(self.grid_overlay, (0, 0))
+
+        # The controls-help line is constant; render it once
+        self._controls_surf = self.controls_font.render(
+            "↑/↓: Select  |  ENTER: Start  |  ESC: Quit", True, (150, 150, 150)
+        ).convert_alpha()
+
+        # Menu header is constant; render the title and tagline once and
+        # hoist their centering maths out of draw_mission_list
+        try:
+            header_title_font = pygame.font.SysFont("Courier New", 72, bold=True)
+            header_tagline_font = pygame.font.SysFont("Courier New", 18, italic=True)
+        except Exception as e:
+            print(f"[!] Could not load system fonts: {e}")
+            header_title_font = pygame.font.SysFont(None, 72, bold=True)
+            header_tagline_font = pygame.font.SysFont(None, 18)
+        self._title_surf = header_title_font.render(
+            "SIGMA", True, (0, 255, 100)
+        ).convert_alpha()
+        self._title_pos = self._title_surf.get_rect(centerx=self.width // 2, top=40)
+        self._tagline_surf = header_tagline_font.render(
+            "ADVANCED THREAT SIMULATION PLATFORM", True, (100, 255, 100)
+        ).convert_alpha()
+        self._tagline_pos = (
+            self.width // 2 - self._tagline_surf.get_width() // 2,
+            120,
+        )
 
-        # Pre-generate CRT scanline overlay surface
-        self.scanline_overlay = self.create_scanline_overlay()
+        # Static splash text for show_mission_start, rendered once; only
+        # the mission title varies per launch
+        self._splash_desc = self.large_font.render(
+            "MISSION STARTED", True, (0, 200, 0)
+        ).convert_alpha()
+        self._splash_prompt = self.font.render(
+            "Press any key to continue...", True, (100, 200, 100)
+        ).convert_alpha()
 
         # Game state
         self.particle_systems: List[Any] = []
@@ -83,16 +232,6 @@ class GameEngine:
         """Toggle sound on/off"""
         return self.sound_manager.toggle_mute()
 
-    def create_scanline_overlay(self):
-        """Create semi-transparent black horizontal lines to simulate CRT scanlines."""
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 0))  # Fully transparent initially
-        line_color = (0, 255, 0, 20)  # Very faint green line
-
-        for y in range(0, self.height, 3):  # Every 3 pixels
-            pygame.draw.line(overlay, line_color, (0, y), (self.width, y))
-        return overlay
-
     def handle_events(self):
         """Process key and quit events with sound feedback."""
         for event in pygame.event.get():
@@ -100,6 +239,7 @@ class GameEngine:
                 self.running = False
 
             elif event.type == pygame.KEYDOWN:
+                self._dirty = True
                 # Handle global key events
                 if event.key == pygame.K_ESCAPE:
                     if not self.confirm_exit():
@@ -133,28 +273,42 @@ class GameEngine:
                 elif self.state == "loading" and event.key:
                     self.complete_loading()
 
+    def _modal_wait(self, render_fn, handler):
+        """Draw a static modal screen once, then block until handled.
+
+        render_fn draws the screen; handler receives each event and
+        returns True when the modal should close. Keeps the event.wait
+        pattern (and its ~0% idle CPU) in one place for every modal.
+        """
+        render_fn()
+        pygame.display.flip()
+        while True:
+            if handler(pygame.event.wait()):
+                return
+
     def confirm_exit(self):
         """Show exit confirmation dialog."""
-        confirm_font = pygame.font.SysFont("Courier New", 22, bold=True)
-        confirming = True
-        while confirming:
+
+        def render():
             self.screen.fill((0, 0, 0))
-            msg1 = confirm_font.render("Exit SIGMA?", True, (0, 255, 0))
-            msg2 = confirm_font.render("Y = Yes    N = No", True, (0, 255, 0))
+            msg1 = self.confirm_font.render("Exit SIGMA?", True, (0, 255, 0))
+            msg2 = self.confirm_font.render("Y = Yes    N = No", True, (0, 255, 0))
             self.screen.blit(msg1, (self.width // 2 - 100, self.height // 2 - 30))
             self.screen.blit(msg2, (self.width // 2 - 120, self.height // 2 + 10))
-            pygame.display.flip()
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+        def handle(event):
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_y:
                     pygame.quit()
                     sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_y:
-                        pygame.quit()
-                        sys.exit()
-                    elif event.key == pygame.K_n:
-                        confirming = False
+                elif event.key == pygame.K_n:
+                    return True
+            return False
+
+        self._modal_wait(render, handle)
 
     def glitch_text(self, text, base_color=(0, 255, 0)):
         """Create a text surface with random flicker glitches.
@@ -175,97 +329,199 @@ class GameEngine:
             print(f"Warning: Invalid color {base_color}, using default green")
             base_color = (0, 255, 0)  # Default to green if invalid
 
-        try:
-            # Render normal text
-            base_surf = self.font.render(text, True, base_color)
-        except Exception as e:
-            print(f"Error rendering text: {e}")
-            # Fallback to white text on error
-            base_surf = self.font.render(text, True, (255, 255, 255))
-
-        # Occasionally draw glitch rectangles
-        glitch_surf = pygame.Surface(base_surf.get_size(), pygame.SRCALPHA)
-        glitch_surf.fill((0, 0, 0, 0))
-
-        # Flicker chance for glitch rectangles
-        if random.random() < 0.15:
-            for _ in range(random.randint(1, 3)):
-                x = random.randint(0, base_surf.get_width() - 10)
-                y = random.randint(0, base_surf.get_height() - 5)
-                w = random.randint(5, 15)
-                h = random.randint(1, 3)
-                color = (0, 255, 0, random.randint(100, 180))
-                pygame.draw.rect(glitch_surf, color, (x, y, w, h))
-        base_surf.blit(glitch_surf, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        # Rasterizing the same strings every frame is the hot cost here;
+        # cache the clean base surface by (text, color) with LRU eviction
+        # and never hand out the cached copy itself (the glitch composite
+        # mutates its target)
+        cache_key = (text, tuple(base_color))
+        cached = self._text_cache.get(cache_key)
+        if cached is None:
+            try:
+                # Render normal text
+                cached = self.font.render(text, True, base_color).convert_alpha()
+            except Exception as e:
+                print(f"Error rendering text: {e}")
+                # Fallback to white text on error
+                cached = self.font.render(text, True, (255, 255, 255)).convert_alpha()
+            self._text_cache[cache_key] = cached
+            if len(self._text_cache) > self._text_cache_max:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(cache_key)
+        base_surf = cached.copy()
+
+        # Flicker chance for glitch rectangles: the common (no-glitch)
+        # case skips the scratch surface and the blend blit entirely;
+        # burst coordinates come from one batched RNG call and stamp
+        # pooled surfaces onto a reused per-size scratch
+        if self._rng.random() < 0.15:
+            size = base_surf.get_size()
+            glitch_surf = self._glitch_scratch.get(size)
+            if glitch_surf is None:
+                glitch_surf = pygame.Surface(size, pygame.SRCALPHA)
+                self._glitch_scratch[size] = glitch_surf
+            glitch_surf.fill((0, 0, 0, 0))
+
+            k = int(self._rng.integers(1, 4))
+            bounds = [
+                max(1, base_surf.get_width() - 15),
+                max(1, base_surf.get_height() - 5),
+            ]
+            coords = self._rng.integers(0, bounds, size=(k, 2))
+            idx = self._rng.integers(0, len(self._glitch_pool), size=k)
+            batch_blit = getattr(glitch_surf, "fblits", glitch_surf.blits)
+            batch_blit(
+                [(self._glitch_pool[i], tuple(c)) for i, c in zip(idx, coords)]
+            )
+            base_surf.blit(glitch_surf, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
         return base_surf
 
     def render_text_with_spacing(self, text, font, color, x, y, spacing=0):
         """Render text with custom letter spacing"""
+        # Cache (surface, advance) per glyph so repeated strings cost one
+        # dict lookup per character instead of two font calls
+        cache = self._spacing_glyph_cache
+        advances = self._advance_cache
         x_offset = 0
+        seq = []
         for char in text:
-            if char == " ":
-                x_offset += font.size(" ")[0] + spacing
-                continue
-
-            char_surface = font.render(char, True, color)
-            self.screen.blit(char_surface, (x + x_offset, y))
-            x_offset += font.size(char)[0] + spacing
+            entry = cache.get((char, color, id(font)))
+            if entry is None:
+                advance = advances.get((char, id(font)))
+                if advance is None:
+                    advance = font.size(char)[0]
+                    advances[(char, id(font))] = advance
+                if char == " ":
+                    entry = (None, advance)
+                else:
+                    entry = (font.render(char, True, color).convert_alpha(), advance)
+                cache[(char, color, id(font))] = entry
+            char_surface, advance = entry
+            if char_surface is not None:
+                seq.append((char_surface, (x + x_offset, y)))
+            x_offset += advance + spacing
+
+        # One batched call instead of a Python-level blit per glyph;
+        # fblits is the pygame-ce fast path, blits the portable fallback
+        batch_blit = getattr(self.screen, "fblits", self.screen.blits)
+        batch_blit(seq)
 
         # Return the total width of the rendered text
         return x_offset
 
-    def draw_mission_list(self):
-        """Draw missions with a clean, modern tech style and proper layout."""
-        # Draw animated background
-        current_time = pygame.time.get_ticks()
-        self.draw_background_effects(current_time)
+    def _build_mission_name_surfs(self):
+        """Pre-render the mission-name labels, truncated to the list width."""
+        container_width = min(800, self.width - 100)
+        container_padding = 20
+        bg_width = container_width - (2 * container_padding)
+        max_text_width = bg_width - 100
 
-        # Initialize fonts
-        try:
-            title_font = pygame.font.SysFont("Courier New", 72, bold=True)
-            tagline_font = pygame.font.SysFont("Courier New", 18, italic=True)
-            mission_font = pygame.font.SysFont("Courier New", 20, bold=True)
-        except Exception as e:
-            print(f"[!] Could not load system fonts: {e}")
-            # Fallback to default fonts
-            title_font = pygame.font.SysFont(None, 72, bold=True)
-            tagline_font = pygame.font.SysFont(None, 18)
-            mission_font = pygame.font.SysFont(None, 20, bold=True)
-
-        # Render and center the title
-        title_text = "SIGMA"
-        title_surface = title_font.render(
-            title_text, True, (0, 255, 100)
-        )  # Bright green
-        title_rect = title_surface.get_rect(centerx=self.width // 2, top=40)
-        self.screen.blit(title_surface, title_rect)
-
-        # Simple tagline without animation
-        tagline = "ADVANCED THREAT SIMULATION PLATFORM"
-        tagline_surf = tagline_font.render(tagline, True, (100, 255, 100))
-        self.screen.blit(
-            tagline_surf, (self.width // 2 - tagline_surf.get_width() // 2, 120)
+        surfs = []
+        for mission in self.missions:
+            # Measure with font.size (metrics only) and rasterize once at
+            # the final length instead of rendering per truncation step
+            mission_text = f"MISSION: {mission['name']}"
+            while (
+                self.mission_font.size(mission_text)[0] > max_text_width
+                and len(mission_text) > 10
+            ):
+                mission_text = mission_text[:-4] + "..."
+            surf = self.mission_font.render(mission_text, True, (220, 220, 220))
+            surfs.append(surf.convert_alpha())
+        return surfs
+
+    def _build_mission_atlas(self):
+        """Compose the full mission list into one SRCALPHA atlas surface.
+
+        Rows use the same 50 px height / 10 px spacing pitch as
+        draw_mission_list, so the per-frame path can blit the visible
+        window with a single area blit.
+        """
+        container_width = min(800, self.width - 100)
+        bg_width = container_width - 40
+        row_pitch = 60  # mission_height + mission_spacing
+        atlas = pygame.Surface(
+            (bg_width, max(1, len(self.missions) * row_pitch)), pygame.SRCALPHA
         )
+        for i, mission in enumerate(self.missions):
+            text_y = i * row_pitch + 13  # (mission_height - 24) // 2
+            atlas.blit(self._mission_name_surfs[i], (50, text_y))
 
-        # Mission list container
+            diff_surf = self._diff_surfs.get(
+                mission["difficulty"].upper(), self._diff_surfs["HARD"]
+            )
+            atlas.blit(diff_surf, (bg_width - diff_surf.get_width() - 20, text_y))
+        return atlas.convert_alpha()
+
+    def _selected_row_rect(self):
+        """On-screen rect of the selected mission row (mirrors the layout
+        maths in draw_mission_list)."""
         container_width = min(800, self.width - 100)
         container_height = min(400, self.height - 250)
         container_x = (self.width - container_width) // 2
         container_y = 170
         container_padding = 20
-
-        # Draw container background
-        container_surface = pygame.Surface(
-            (container_width, container_height), pygame.SRCALPHA
+        mission_height = 50
+        mission_spacing = 10
+        visible_missions = min(
+            5,
+            (container_height - 2 * container_padding)
+            // (mission_height + mission_spacing),
         )
-        container_surface.fill((0, 20, 10, 200))  # Semi-transparent dark green
-
-        # Add border
-        border_color = (0, 120, 60, 200)
-        pygame.draw.rect(
-            container_surface, border_color, container_surface.get_rect(), 2
+        start_index = max(
+            0,
+            min(
+                self.selected_index - visible_missions // 2,
+                len(self.missions) - visible_missions,
+            ),
+        )
+        y = (
+            container_y
+            + container_padding
+            + (self.selected_index - start_index) * (mission_height + mission_spacing)
         )
-        self.screen.blit(container_surface, (container_x, container_y))
+        return pygame.Rect(
+            container_x + container_padding,
+            y,
+            container_width - 2 * container_padding,
+            mission_height,
+        )
+
+    def draw_mission_list(self):
+        """Draw missions with a clean, modern tech style and proper layout.
+
+        The composed menu frame only changes when the selection or the
+        mission list does, so it is rendered once per (selected_index,
+        mission count) key and replayed as a single blit until then.
+        """
+        key = (self.selected_index, len(self.missions))
+        if self._menu_bg_key != key or self._menu_bg_surface is None:
+            self._menu_bg_key = key
+            self._menu_bg_surface = self._render_menu_frame()
+        self.screen.blit(self._menu_bg_surface, (0, 0))
+
+    def _render_menu_frame(self):
+        """Compose the full menu (header, list, controls) off-screen.
+
+        Starts from the baked background, which already carries the
+        scanlines and grid.
+        """
+        surface = self._bg.copy()
+
+        # Title and tagline are constant; blit the surfaces pre-rendered
+        # in __init__ instead of rasterizing them every frame
+        surface.blit(self._title_surf, self._title_pos)
+        surface.blit(self._tagline_surf, self._tagline_pos)
+
+        # Mission list container
+        container_width = min(800, self.width - 100)
+        container_height = min(400, self.height - 250)
+        container_x = (self.width - container_width) // 2
+        container_y = 170
+        container_padding = 20
+
+        # Draw container background (static chrome, built in __init__)
+        surface.blit(self._container_surf, (container_x, container_y))
 
         # Mission list settings (font already set in the try-except block above)
         mission_height = 50
@@ -288,125 +544,101 @@ class GameEngine:
         # Calculate vertical position of the first mission
         start_y = container_y + container_padding
 
-        for i in range(
-            start_index, min(start_index + visible_missions, len(self.missions))
-        ):
-            mission = self.missions[i]
-            is_selected = i == self.selected_index
-            y_pos = start_y + (i - start_index) * (mission_height + mission_spacing)
-
-            # Mission background
-            bg_width = container_width - (2 * container_padding)
-            bg_height = mission_height
-            bg_x = container_x + container_padding
-            bg_y = y_pos
-
-            # Draw selection highlight
-            if is_selected:
-                bg_surf = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
-                pygame.draw.rect(
-                    bg_surf,
-                    (0, 50, 25, 200),  # Darker green for selected
-                    bg_surf.get_rect(),
-                    border_radius=4,
-                )
-                # Left accent bar
-                pygame.draw.rect(bg_surf, (0, 255, 100), (0, 0, 4, bg_height))
-                self.screen.blit(bg_surf, (bg_x, bg_y))
+        bg_width = container_width - (2 * container_padding)
+        bg_x = container_x + container_padding
+        row_pitch = mission_height + mission_spacing
 
-            # Draw mission text
-            text_y = bg_y + (mission_height - 24) // 2  # Center vertically
+        # The whole list lives in a pre-composed atlas; one area blit
+        # shows the visible window regardless of mission count
+        n_visible = min(visible_missions, len(self.missions) - start_index)
+        atlas_area = pygame.Rect(
+            0,
+            start_index * row_pitch,
+            bg_width,
+            max(0, n_visible * row_pitch - mission_spacing),
+        )
+        surface.blit(self._mission_atlas, (bg_x, start_y), atlas_area)
 
-            # Mission prefix (only show for selected)
-            if is_selected:
-                prefix = ">>"
-                prefix_surf = mission_font.render(prefix, True, (0, 255, 100))
-                self.screen.blit(prefix_surf, (bg_x + 15, text_y))
+        # Selection decorations are the only per-frame composition
+        if 0 <= self.selected_index < len(self.missions):
+            bg_y = start_y + (self.selected_index - start_index) * row_pitch
+            # Highlight surface is pre-drawn in __init__
+            surface.blit(self._highlight_surf, (bg_x, bg_y))
 
-            # Mission name
-            mission_text = f"MISSION: {mission['name']}"
-            mission_surf = mission_font.render(mission_text, True, (220, 220, 220))
-
-            # Truncate text if too long
-            max_text_width = bg_width - 100
-            if mission_surf.get_width() > max_text_width:
-                while (
-                    mission_surf.get_width() > max_text_width and len(mission_text) > 10
-                ):
-                    mission_text = mission_text[:-4] + "..."
-                    mission_surf = mission_font.render(
-                        mission_text, True, (220, 220, 220)
-                    )
-
-            self.screen.blit(mission_surf, (bg_x + 50, text_y))
-
-            # Difficulty - right aligned
-            difficulty = mission["difficulty"].lower()
-            if difficulty == "easy":
-                diff_color = (100, 255, 100)  # Green
-            elif difficulty == "medium":
-                diff_color = (255, 200, 0)  # Yellow
-            else:
-                diff_color = (255, 100, 100)  # Red
-
-            difficulty_text = f"{mission['difficulty'].upper()}"
-            diff_surf = mission_font.render(difficulty_text, True, diff_color)
-            diff_x = bg_x + bg_width - diff_surf.get_width() - 20
-            self.screen.blit(diff_surf, (diff_x, text_y))
-
-        # Draw controls help at the bottom
-        controls_font = pygame.font.SysFont("Arial", 14)
-        controls_text = "↑/↓: Select  |  ENTER: Start  |  ESC: Quit"
-        controls_surf = controls_font.render(controls_text, True, (150, 150, 150))
-        controls_x = self.width - controls_surf.get_width() - 20
+            # Re-draw the selected row's text over the highlight
+            text_y = bg_y + (mission_height - 24) // 2  # Center vertically
+            surface.blit(self._prefix_surf, (bg_x + 15, text_y))
+            surface.blit(
+                self._mission_atlas,
+                (bg_x, text_y),
+                pygame.Rect(
+                    0,
+                    self.selected_index * row_pitch + 13,
+                    bg_width,
+                    mission_height - 13,
+                ),
+            )
+
+        # Draw controls help at the bottom (pre-rendered in __init__)
+        controls_x = self.width - self._controls_surf.get_width() - 20
         controls_y = self.height - 30
-        self.screen.blit(controls_surf, (controls_x, controls_y))
+        surface.blit(self._controls_surf, (controls_x, controls_y))
+
+        return surface
 
     def type_text(self, text, pos, delay=30):
-        """Render text with typing animation effect."""
-        displayed_text = ""
-        for char in text:
-            displayed_text += char
-            self.screen.fill(
-                (0, 0, 0), (pos[0], pos[1], self.width, 40)
-            )  # Clear previous text line
-            rendered = self.font.render(displayed_text, True, (0, 255, 0))
-            self.screen.blit(rendered, pos)
-            pygame.display.flip()
-            pygame.time.delay(delay)
-
-            diff_text = self.font.render(f"[{difficulty}]", True, diff_color)
-            self.screen.blit(diff_text, (self.width - 150, y_pos + 10))
-
-        # Draw instructions at the bottom
-        instructions = [
-            "↑/↓: Select Mission",
-            "ENTER: Start Mission",
-            "M: Toggle Mute",
-            "ESC: Quit",
-        ]
-
-        for i, text in enumerate(instructions):
-            text_surface = self.font.render(text, True, (100, 200, 100))
-            self.screen.blit(
-                text_surface, (self.width - 250, self.height - 30 - i * 25)
-            )
+        """Start the typing animation; run() advances it without blocking.
 
-        # Apply CRT scanline overlay for retro effect
-        self.screen.blit(self.scanline_overlay, (0, 0))
+        Arms a small state machine consumed by _advance_typer so the
+        event loop keeps running while characters appear.
+        """
+        self.screen.fill((0, 0, 0), (pos[0], pos[1], self.width, 40))
+        self._typer = {
+            "text": text,
+            "pos": pos,
+            "delay": delay,
+            "idx": 0,
+            "cursor_x": pos[0],
+            "next_tick": pygame.time.get_ticks(),
+        }
+
+    def _advance_typer(self, current_time: int):
+        """Draw any typing-animation characters that are due this frame.
+
+        Renders only the newly typed glyph each step instead of
+        re-rasterizing the whole growing string (O(N) renders, not
+        O(N^2)); glyphs are cached across messages, and only the glyph's
+        rect is pushed to the display.
+        """
+        typer = self._typer
+        if typer is None:
+            return
+
+        # Bind the hot callables once; attribute lookups inside the
+        # per-character loop are pure Python overhead
+        glyph_cache = self._glyph_cache
+        render = self.font.render
+        blit = self.screen.blit
+        update = pygame.display.update
+        text, pos = typer["text"], typer["pos"]
+        while typer["idx"] < len(text) and current_time >= typer["next_tick"]:
+            char = text[typer["idx"]]
+            glyph = glyph_cache.get(char)
+            if glyph is None:
+                glyph = render(char, True, (0, 255, 0))
+                glyph_cache[char] = glyph
+            blit(glyph, (typer["cursor_x"], pos[1]))
+            update(
+                pygame.Rect(
+                    typer["cursor_x"], pos[1], glyph.get_width(), glyph.get_height()
+                )
+            )
+            typer["cursor_x"] += glyph.get_width()
+            typer["idx"] += 1
+            typer["next_tick"] += typer["delay"]
 
-    def type_text(self, text, pos, delay=30):
-        """Render text with typing animation effect."""
-        displayed_text = ""
-        for char in text:
-            displayed_text += char
-            self.screen.fill(
-                (0, 0, 0), (pos[0], pos[1], self.width, 40)
-            )  # Clear previous text line
-            rendered = self.font.render(displayed_text, True, (0, 255, 0))
-            self.screen.blit(rendered, pos)
-            pygame.display.flip()
-            pygame.time.delay(delay)
+        if typer["idx"] >= len(text):
+            self._typer = None
 
     def start_loading(self, mission: Dict[str, Any]):
         """Start loading a mission with appropriate animation."""
@@ -440,45 +672,42 @@ class GameEngine:
 
     def show_mission_start(self, mission: Dict[str, Any]):
         """Show mission start screen."""
-        self.screen.fill((0, 0, 0))
 
-        # Display mission info
-        title = self.title_font.render(mission["name"].upper(), True, (0, 255, 0))
-        title_rect = title.get_rect(
-            centerx=self.width // 2, centery=self.height // 2 - 50
-        )
-        self.screen.blit(title, title_rect)
+        def render():
+            self.screen.fill((0, 0, 0))
 
-        # Display mission description
-        desc = self.large_font.render("MISSION STARTED", True, (0, 200, 0))
-        desc_rect = desc.get_rect(
-            centerx=self.width // 2, centery=self.height // 2 + 20
-        )
-        self.screen.blit(desc, desc_rect)
+            # Display mission info
+            title = self.title_font.render(mission["name"].upper(), True, (0, 255, 0))
+            title_rect = title.get_rect(
+                centerx=self.width // 2, centery=self.height // 2 - 50
+            )
+            self.screen.blit(title, title_rect)
 
-        # Display press any key to continue
-        prompt = self.font.render("Press any key to continue...", True, (100, 200, 100))
-        prompt_rect = prompt.get_rect(centerx=self.width // 2, bottom=self.height - 50)
-        self.screen.blit(prompt, prompt_rect)
+            # Display mission description (static text, pre-rendered in __init__)
+            desc_rect = self._splash_desc.get_rect(
+                centerx=self.width // 2, centery=self.height // 2 + 20
+            )
+            self.screen.blit(self._splash_desc, desc_rect)
 
-        pygame.display.flip()
+            # Display press any key to continue
+            prompt_rect = self._splash_prompt.get_rect(
+                centerx=self.width // 2, bottom=self.height - 50
+            )
+            self.screen.blit(self._splash_prompt, prompt_rect)
 
-        # Wait for key press
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+        def handle(event):
+            if event.type == pygame.QUIT:
+                self.running = False
+                return True
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
                     self.running = False
-                    waiting = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.running = False
-                        waiting = False
-                    else:
-                        waiting = False
-                        self.play_sound("select")
+                else:
+                    self.play_sound("select")
+                return True
+            return False
 
-            self.clock.tick(60)
+        self._modal_wait(render, handle)
 
     def run(self):
         """Main game loop: handle events, update state, draw, control FPS."""
@@ -495,19 +724,39 @@ class GameEngine:
                 if self.loading_animation.update():
                     self.complete_loading()
 
-            # Draw the current state
-            self.screen.fill((0, 0, 0))  # Clear screen
+            # Advance any active typing animation without blocking
+            self._advance_typer(current_time)
 
+            # The menu is static between key presses; only redraw it on
+            # input or on the ~120 ms flicker beat. Loading always animates.
+            needs_draw = True
+            flicker_only = False
             if self.state == "menu":
-                self.draw_mission_list()
-            elif self.state == "loading" and self.loading_animation:
-                self.loading_animation.draw()
-
-            # Apply scanline overlay for retro effect
-            self.screen.blit(self.scanline_overlay, (0, 0))
-
-            # Update display
-            pygame.display.flip()
+                if self._dirty:
+                    self._dirty = False
+                    self._last_flicker_ms = current_time
+                elif current_time - self._last_flicker_ms >= 120:
+                    self._last_flicker_ms = current_time
+                    flicker_only = True
+                else:
+                    needs_draw = False
+
+            if needs_draw:
+                # Draw the current state over the pre-composited scanline
+                # background (replaces fill + alpha overlay per frame)
+                self.screen.blit(self._bg, (0, 0))
+
+                if self.state == "menu":
+                    self.draw_mission_list()
+                elif self.state == "loading" and self.loading_animation:
+                    self.loading_animation.draw()
+
+                # Flicker-only menu updates present just the selected row;
+                # input-driven frames and animations push the whole screen
+                if flicker_only:
+                    pygame.display.update(self._selected_row_rect())
+                else:
+                    pygame.display.flip()
             self.clock.tick(60)
 
         # Clean up
@@ -519,19 +768,6 @@ class GameEngine:
         # Update flicker effect for selected mission
         self.flicker_timer = (self.flicker_timer + 1) % 30
 
-        # Add subtle background animation
-        self.draw_background_effects(current_time)
-
-    def draw_background_effects(self, current_time: int):
-        """Draw subtle background effects for the menu"""
-        # Draw a subtle grid
-        for x in range(0, self.width, 20):
-            alpha = 5 + 5 * math.sin(current_time / 1000 + x / 100)
-            pygame.draw.line(self.screen, (0, 20, 0), (x, 0), (x, self.height))
-        for y in range(0, self.height, 20):
-            alpha = 5 + 5 * math.sin(current_time / 1000 + y / 100)
-            pygame.draw.line(self.screen, (0, 20, 0), (0, y), (self.width, y))
-
 
 if __name__ == "__main__":
     # Create and run the game
@@ -1,10 +1,113 @@
 import os
 import pygame
-import random
-import math
+import threading
+import wave
 import numpy
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List
+
+# Generated audio is cached as WAV between runs so a warm start loads a
+# few MB from disk instead of re-running millions of numpy.sin calls.
+# Anchored next to this module so the location is independent of the
+# process working directory.
+_SOUND_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "assets", "sounds", "_cache"
+)
+
+
+def _write_wav(path: str, raw: bytes) -> None:
+    """Write raw mixer-format (44.1kHz int16 stereo) frames as a WAV."""
+    os.makedirs(_SOUND_CACHE_DIR, exist_ok=True)
+    with wave.open(path, "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(44100)
+        wav_file.writeframes(raw)
+
+
+def _cached_sound(key: str, factory: Callable[[], pygame.mixer.Sound]) -> pygame.mixer.Sound:
+    """Return factory()'s output, cached on disk as a WAV keyed by name.
+
+    The mixer runs at a fixed 44.1kHz int16 stereo format, so the raw
+    sample bytes round-trip through a WAV file unchanged. Cache misses
+    (or unwritable directories) fall back to plain generation.
+    """
+    path = os.path.join(_SOUND_CACHE_DIR, f"{key}.wav")
+    if os.path.exists(path):
+        try:
+            return pygame.mixer.Sound(path)
+        except Exception as e:
+            print(f"[!] Error loading cached sound '{key}': {e}")
+
+    sound = factory()
+    try:
+        _write_wav(path, sound.get_raw())
+    except Exception as e:
+        print(f"[!] Error caching sound '{key}': {e}")
+    return sound
+
+
+def _cached_music_path(key: str, factory: Callable[[], pygame.mixer.Sound]) -> Optional[str]:
+    """Return a WAV path for a generated music track, creating it once.
+
+    Music streams from disk through pygame.mixer.music, so only the
+    file path is retained; the decoded PCM (tens of MB for the long
+    tracks) never stays resident. Returns None if the cache directory
+    is unwritable, in which case the caller falls back to an in-memory
+    Sound.
+    """
+    path = os.path.join(_SOUND_CACHE_DIR, f"{key}.wav")
+    if os.path.exists(path):
+        return path
+    try:
+        _write_wav(path, factory().get_raw())
+        return path
+    except Exception as e:
+        print(f"[!] Error caching music '{key}': {e}")
+        return None
+
+
+def _make_sound(stereo: numpy.ndarray) -> pygame.mixer.Sound:
+    """Build a Sound straight from an int16 stereo buffer.
+
+    Sound(buffer=...) reads the array through the buffer protocol and
+    copies the raw bytes once into the mixer chunk, skipping
+    pygame.sndarray's validation layer.
+    """
+    return pygame.mixer.Sound(buffer=numpy.ascontiguousarray(stereo))
+
+
+def _synth_sine(n_samples: int, frequency: float, sample_rate: int) -> numpy.ndarray:
+    """Generate a stereo int16 sine buffer in one vectorized pass.
+
+    Module-level so any future runtime-generated SFX (envelopes, FM)
+    can reuse the same buffer pipeline.
+    """
+    t = numpy.arange(n_samples, dtype=numpy.float32)
+    wave = (32767 * 0.5 * numpy.sin(2 * numpy.pi * frequency * t / sample_rate)).astype(
+        numpy.int16
+    )
+    # Broadcast the mono wave across both channels as a view; only the
+    # final contiguous copy materializes the second column
+    return numpy.ascontiguousarray(numpy.broadcast_to(wave[:, None], (n_samples, 2)))
+
+
+def _to_stereo_int16(mono: numpy.ndarray, right_gain: float = 1.0) -> numpy.ndarray:
+    """Scale a [-1, 1] float buffer to int16 and duplicate it per channel.
+
+    Writes straight into a preallocated (n, 2) buffer: one scaling cast
+    per channel, instead of cast -> column_stack -> cast again. A
+    right_gain below 1.0 attenuates the right channel for the slight
+    stereo variation some effects use.
+    """
+    out = numpy.empty((len(mono), 2), dtype=numpy.int16)
+    numpy.multiply(mono, 32767, out=out[:, 0], casting="unsafe")
+    if right_gain == 1.0:
+        out[:, 1] = out[:, 0]
+    else:
+        numpy.multiply(mono, 32767 * right_gain, out=out[:, 1], casting="unsafe")
+    return out
 
 
 class SoundType(Enum):
@@ -21,12 +124,14 @@ class SoundTrack:
         sound_type: SoundType = SoundType.SFX,
         volume: float = 1.0,
         loop: bool = False,
+        path: Optional[str] = None,
     ):
         self.name = name
         self.sound = sound
         self.type = sound_type
         self.volume = volume
         self.loop = loop
+        self.path = path  # Set for tracks streamed from disk
         self.channel: Optional[pygame.mixer.Channel] = None
 
 
@@ -46,6 +151,13 @@ class SoundManager:
         self.sfx_volume = 0.7
         self.ambient_volume = 0.4
 
+        # Live one-shots keyed by channel index (pygame Channel objects
+        # compare by identity, so they cannot key a dict), mapping to the
+        # explicit play() volume or None for default-volume sounds
+        self._active_sfx: Dict[int, Optional[float]] = {}
+        # Round-robin cursor over the one-shot channels (2..15)
+        self._next_sfx = 2
+
         # Create a separate channel for music and ambient
         self.music_channel = pygame.mixer.Channel(0)
         self.ambient_channel = pygame.mixer.Channel(1)
@@ -56,48 +168,87 @@ class SoundManager:
         self.setup_ambient()
 
     def setup_sounds(self):
-        """Initialize all game sound effects with default fallbacks"""
-        # UI Sounds
-        self.load_sound(
-            "select", self._create_beep(440, 50)
-        )  # Higher pitch for selection
-        self.load_sound("confirm", self._create_beep(660, 100))  # Confirmation sound
-        self.load_sound(
-            "back", self._create_beep(220, 50)
-        )  # Lower pitch for back/cancel
-        self.load_sound("error", self._create_error_sound())
-        self.load_sound("typing", self._create_typing_sound())
-        self.load_sound("glitch", self._create_glitch(500))
-
-        # Mission-specific sounds
-        self.load_sound("hack_start", self._create_glitch(3000))
-        self.load_sound("download", self._create_download_sound())
-        self.load_sound("decrypt", self._create_decrypt_sound())
-        self.load_sound("success", self._create_success_sound())
-        self.load_sound("failure", self._create_failure_sound())
-
-        # Ambient sounds - removed static sound as per user request
-        self.load_sound(
-            "keyboard", self._create_keyboard_sound(5000)
-        )  # 5 seconds of typing
+        """Register sound factories; synthesis happens off the critical path.
+
+        Each effect is generated lazily on first play (or by the
+        background warm-up thread) instead of synthesizing several
+        seconds of audio before the window can appear.
+        """
+        self._sound_lock = threading.Lock()
+        self._factories = {
+            # UI Sounds
+            "select": lambda: self._create_beep(440, 50),  # Higher pitch for selection
+            "confirm": lambda: self._create_beep(660, 100),  # Confirmation sound
+            "back": lambda: self._create_beep(220, 50),  # Lower pitch for back/cancel
+            "error": self._create_error_sound,
+            "typing": self._create_typing_sound,
+            "glitch": lambda: self._create_glitch(500),
+            # Mission-specific sounds
+            "hack_start": lambda: self._create_glitch(3000),
+            "download": self._create_download_sound,
+            "decrypt": self._create_decrypt_sound,
+            "success": self._create_success_sound,
+            "failure": self._create_failure_sound,
+            # Ambient sounds - removed static sound as per user request
+            "keyboard": lambda: self._create_keyboard_sound(5000),  # 5s of typing
+        }
+        # Pre-generate everything in the background so first plays
+        # usually hit a warm cache
+        threading.Thread(target=self._warm_sounds, daemon=True).start()
+
+    def _ensure_sound(self, name: str) -> Optional[pygame.mixer.Sound]:
+        """Materialize a registered sound on first use (thread-safe)."""
+        sound = self.sounds.get(name)
+        if sound is not None:
+            return sound
+        factory = self._factories.get(name)
+        if factory is None:
+            return None
+        # Generate outside the lock so concurrent callers overlap; a rare
+        # duplicate generation is simply discarded at insert time
+        generated = _cached_sound(name, factory)
+        with self._sound_lock:
+            if name not in self.sounds:
+                self.load_sound(name, generated)
+        return self.sounds.get(name)
+
+    def _warm_sounds(self):
+        """Background warm-up pass over every registered factory.
+
+        NumPy releases the GIL inside its large array kernels, so the
+        independent generators genuinely run in parallel across a small
+        thread pool instead of back to back.
+        """
+        with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as pool:
+            futures = {
+                pool.submit(self._ensure_sound, name): name
+                for name in list(self._factories)
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"[!] Error pre-generating sound '{futures[future]}': {e}")
 
     def setup_music(self):
-        """Set up music tracks"""
-        # Create music tracks with procedurally generated music
-        self.music_tracks = {
-            "menu": SoundTrack(
-                "menu", self._create_menu_music(), SoundType.MUSIC, 0.6, True
-            ),
-            "hacking": SoundTrack(
-                "hacking", self._create_hacking_music(), SoundType.MUSIC, 0.5, True
-            ),
-            "tense": SoundTrack(
-                "tense", self._create_tense_music(), SoundType.MUSIC, 0.5, True
-            ),
-            "success": SoundTrack(
-                "success", self._create_success_music(), SoundType.MUSIC, 0.5, False
-            ),
-        }
+        """Set up music tracks.
+
+        Tracks are rendered to the WAV cache once and then streamed from
+        disk by pygame.mixer.music; only when the cache is unwritable is
+        a track kept in memory as a Sound.
+        """
+        self.music_tracks = {}
+        for name, factory, volume, loop in (
+            ("menu", self._create_menu_music, 0.6, True),
+            ("hacking", self._create_hacking_music, 0.5, True),
+            ("tense", self._create_tense_music, 0.5, True),
+            ("success", self._create_success_music, 0.5, False),
+        ):
+            path = _cached_music_path(f"music_{name}", factory)
+            sound = None if path else _cached_sound(f"music_{name}", factory)
+            self.music_tracks[name] = SoundTrack(
+                name, sound, SoundType.MUSIC, volume, loop, path=path
+            )
 
     def setup_ambient(self):
         """Set up ambient sound tracks"""
@@ -129,27 +280,45 @@ class SoundManager:
         self, name: str, volume: float = None, loop: bool = False
     ) -> Optional[pygame.mixer.Channel]:
         """Play a sound effect by name"""
-        if self.muted or name not in self.sounds or self.sounds[name] is None:
+        if self.muted:
             return None
 
         try:
-            sound = self.sounds[name]
+            sound = self._ensure_sound(name)
             if sound is None:
                 return None
 
-            # Use provided volume or default SFX volume
-            sound.set_volume(volume if volume is not None else self.sfx_volume)
-
-            # Find an available channel
-            channel = pygame.mixer.find_channel(force=False)
-            if channel is None:
-                channel = pygame.mixer.Channel(2)  # Use a higher channel for one-shots
+            # Round-robin over the one-shot channels; only scan for a free
+            # one when the cursor lands on a busy channel
+            ch_idx = self._next_sfx
+            self._next_sfx = 2 + (self._next_sfx - 1) % 14
+            if pygame.mixer.Channel(ch_idx).get_busy():
+                for idx in range(2, pygame.mixer.get_num_channels()):
+                    if not pygame.mixer.Channel(idx).get_busy():
+                        ch_idx = idx
+                        break
+            channel = pygame.mixer.Channel(ch_idx)
+
+            # The channel volume carries the SFX level and is reset on
+            # every play (it persists across plays — e.g. the zero a mute
+            # leaves behind); the Sound's own volume only carries explicit
+            # per-play levels
+            if volume is None:
+                sound.set_volume(1.0)
+                channel.set_volume(self.sfx_volume)
+            else:
+                sound.set_volume(volume)
+                channel.set_volume(1.0)
 
             if loop:
                 channel.play(sound, loops=-1)  # -1 means loop indefinitely
             else:
                 channel.play(sound)
 
+            # Track by index so set_volumes and unmute can restore live
+            # one-shots; explicit volumes are left alone there
+            self._active_sfx[ch_idx] = volume
+
             return channel
         except Exception as e:
             print(f"[!] Error playing sound '{name}': {e}")
@@ -160,9 +329,10 @@ class SoundManager:
 
         # Update all volumes based on mute state
         if self.muted:
-            # Mute all channels
+            # Mute all channels and the streaming music player
             for i in range(pygame.mixer.get_num_channels()):
                 pygame.mixer.Channel(i).set_volume(0)
+            pygame.mixer.music.set_volume(0)
         else:
             # Restore volumes
             self.set_volumes(self.music_volume, self.sfx_volume, self.ambient_volume)
@@ -179,20 +349,28 @@ class SoundManager:
 
         # Update currently playing sounds
         if self.current_music:
-            self.music_channel.set_volume(self.music_volume * self.current_music.volume)
+            target = self.music_volume * self.current_music.volume
+            if self.current_music.path:
+                pygame.mixer.music.set_volume(target)
+            else:
+                self.music_channel.set_volume(target)
 
         if self.current_ambient:
             self.ambient_channel.set_volume(
                 self.ambient_volume * self.current_ambient.volume
             )
 
-        # Update SFX channels (this will affect future SFX plays)
-        for i in range(2, pygame.mixer.get_num_channels()):
-            channel = pygame.mixer.Channel(i)
-            if channel.get_busy():
-                # Get current volume scale if we can
-                current_volume = getattr(channel, "_last_volume", 1.0)
-                channel.set_volume(self.sfx_volume * current_volume)
+        # Update live SFX through their channel volume (the Sound object's
+        # volume is global and may be shared); entries whose channel has
+        # gone idle are dropped on the way through
+        for ch_idx, explicit in list(self._active_sfx.items()):
+            channel = pygame.mixer.Channel(ch_idx)
+            if not channel.get_busy():
+                del self._active_sfx[ch_idx]
+            elif explicit is None:
+                channel.set_volume(self.sfx_volume)
+            else:
+                channel.set_volume(1.0)  # Explicit volumes are left alone
 
     def play_music(self, track_name: str, fade_in: int = 1000) -> bool:
         """Play a music track by name with optional fade-in"""
@@ -201,24 +379,31 @@ class SoundManager:
 
         try:
             track = self.music_tracks[track_name]
-            if track.sound is None:
+            if track.sound is None and track.path is None:
                 return False
 
             # Stop current music if playing
             if self.current_music:
                 self.stop_music()
 
-            # Set volume and play with fade in
-            track.sound.set_volume(0)  # Start at 0 for fade in
-            self.music_channel.play(track.sound, loops=-1 if track.loop else 0)
-            self.music_channel.set_volume(self.music_volume * track.volume)
+            if track.path:
+                # Stream from disk; the decoded PCM never sits in RAM
+                pygame.mixer.music.load(track.path)
+                pygame.mixer.music.set_volume(self.music_volume * track.volume)
+                pygame.mixer.music.play(
+                    -1 if track.loop else 0, fade_ms=max(0, fade_in)
+                )
+                self.current_music = track
+                return True
 
-            # Fade in if specified
-            if fade_in > 0:
-                self.music_channel.set_volume(0)
-                self.music_channel.fadeout(0)  # Stop any pending fades
-                self.music_channel.play(track.sound, loops=-1 if track.loop else 0)
-                self.music_channel.fade(self.music_volume * track.volume, fade_in)
+            # Single play; the mixer's native fade_ms handles the fade-in
+            # (the old path started the channel twice and left the sound
+            # itself muted at volume 0)
+            track.sound.set_volume(1.0)
+            self.music_channel.play(
+                track.sound, loops=-1 if track.loop else 0, fade_ms=max(0, fade_in)
+            )
+            self.music_channel.set_volume(self.music_volume * track.volume)
 
             self.current_music = track
             return True
@@ -245,18 +430,15 @@ class SoundManager:
             if self.current_ambient:
                 self.stop_ambient()
 
-            # Set volume and play with fade in
-            track.sound.set_volume(0)  # Start at 0 for fade in
-            self.ambient_channel.play(track.sound, loops=-1 if track.loop else 0)
+            # Single play; the mixer's native fade_ms handles the fade-in
+            # (the old path started the channel twice and left the sound
+            # itself muted at volume 0)
+            track.sound.set_volume(1.0)
+            self.ambient_channel.play(
+                track.sound, loops=-1 if track.loop else 0, fade_ms=max(0, fade_in)
+            )
             self.ambient_channel.set_volume(self.ambient_volume * track.volume)
 
-            # Fade in if specified
-            if fade_in > 0:
-                self.ambient_channel.set_volume(0)
-                self.ambient_channel.fadeout(0)  # Stop any pending fades
-                self.ambient_channel.play(track.sound, loops=-1 if track.loop else 0)
-                self.ambient_channel.fade(self.ambient_volume * track.volume, fade_in)
-
             self.current_ambient = track
             return True
 
@@ -267,7 +449,12 @@ class SoundManager:
     def stop_music(self, fade_out: int = 1000) -> None:
         """Stop the currently playing music with optional fadeout"""
         if self.current_music:
-            if fade_out > 0:
+            if self.current_music.path:
+                if fade_out > 0:
+                    pygame.mixer.music.fadeout(fade_out)
+                else:
+                    pygame.mixer.music.stop()
+            elif fade_out > 0:
                 self.music_channel.fadeout(fade_out)
             else:
                 self.music_channel.stop()
@@ -285,10 +472,12 @@ class SoundManager:
     def pause_all(self) -> None:
         """Pause all audio playback"""
         pygame.mixer.pause()
+        pygame.mixer.music.pause()
 
     def unpause_all(self) -> None:
         """Resume all audio playback"""
         pygame.mixer.unpause()
+        pygame.mixer.music.unpause()
 
     # ==============================================
     # Procedural Sound Generation Methods
@@ -299,61 +488,88 @@ class SoundManager:
         sample_rate = 44100
         duration = 30  # seconds
         n_samples = int(sample_rate * duration)
-        t = numpy.linspace(0, duration, n_samples, False)
-
-        # Create multiple layers of sound
-        bass = 0.2 * numpy.sin(2 * numpy.pi * 110 * t)  # A2
-        pad = 0.15 * numpy.sin(2 * numpy.pi * 220 * t)  # A3
-        arp = 0.1 * numpy.sin(
-            2 * numpy.pi * 440 * t * (1 + 0.1 * numpy.sin(0.5 * t))
-        )  # A4 with vibrato
-
-        # Add some percussion
+        t = numpy.linspace(0, duration, n_samples, False, dtype=numpy.float32)
+
+        # Create multiple layers of sound, accumulated through one scratch
+        # buffer with out= variants instead of a temporary per layer
+        scratch = numpy.multiply(t, 2 * numpy.pi * 110, out=numpy.empty_like(t))
+        audio = numpy.sin(scratch)  # A2 bass
+        audio *= 0.2
+        numpy.multiply(t, 2 * numpy.pi * 220, out=scratch)  # A3 pad
+        numpy.sin(scratch, out=scratch)
+        scratch *= 0.15
+        audio += scratch
+        numpy.multiply(t, 0.5, out=scratch)  # A4 arp with vibrato
+        numpy.sin(scratch, out=scratch)
+        scratch *= 0.1
+        scratch += 1
+        scratch *= t
+        scratch *= 2 * numpy.pi * 440
+        numpy.sin(scratch, out=scratch)
+        scratch *= 0.1
+        audio += scratch
+
+        # Add some percussion: every kick shares one decay envelope, so
+        # scatter it with a single fancy-indexed add instead of a Python
+        # loop of slice assignments
         kick = numpy.zeros_like(t)
         kick_times = numpy.arange(0, duration, 0.5)  # Kick every 0.5 seconds
-        for time in kick_times:
-            start = int(time * sample_rate)
-            end = min(start + 1000, len(kick))  # 1ms kick
-            if start < len(kick):
-                kick[start:end] += numpy.linspace(1, 0, end - start) * 0.3
+        env = numpy.linspace(1, 0, 1000, dtype=numpy.float32) * 0.3  # 1ms kick
+        idx = (kick_times * sample_rate).astype(numpy.intp)[:, None] + numpy.arange(1000)
+        in_range = idx < len(kick)
+        numpy.add.at(kick, idx[in_range], numpy.broadcast_to(env, idx.shape)[in_range])
 
         # Combine all layers
-        audio = 0.7 * (bass + pad + arp) + 0.5 * kick
+        audio *= 0.7
+        kick *= 0.5
+        audio += kick
 
-        # Normalize and convert to stereo
-        audio = numpy.clip(audio, -0.99, 0.99)
-        stereo = numpy.column_stack((audio, audio))
-        return pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        # Normalize and convert to stereo in one pass
+        numpy.clip(audio, -0.99, 0.99, out=audio)
+        return _make_sound(_to_stereo_int16(audio))
 
     def _create_hacking_music(self) -> pygame.mixer.Sound:
         """Create intense hacking music"""
         sample_rate = 44100
         duration = 60  # seconds
         n_samples = int(sample_rate * duration)
-        t = numpy.linspace(0, duration, n_samples, False)
-
-        # Create a pulsing bassline
-        bass_freq = 110 * (1 + 0.1 * numpy.sin(0.5 * t))  # Slight detune
-        bass = 0.25 * numpy.sin(2 * numpy.pi * bass_freq * t)
-
-        # Add arpeggios
-        arp_notes = [220, 277, 330, 440]  # A3, C#4, E4, A4
-        arp = numpy.zeros_like(t)
-        for i in range(len(t)):
-            note_idx = int(t[i] * 4) % len(arp_notes)
-            arp[i] = 0.15 * numpy.sin(2 * numpy.pi * arp_notes[note_idx] * t[i])
-
-        # Add glitch effects
-        glitch = numpy.random.uniform(-0.1, 0.1, len(t))
-        glitch_mask = numpy.random.random(len(t)) > 0.99  # 1% chance of glitch
-        glitch = glitch * glitch_mask
-
-        # Combine and normalize
-        audio = 0.8 * (bass + arp) + 0.3 * glitch
-        audio = numpy.clip(audio, -0.99, 0.99)
-        stereo = numpy.column_stack((audio, audio))
-
-        sound = pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        t = numpy.linspace(0, duration, n_samples, False, dtype=numpy.float32)
+
+        # Create a pulsing bassline, folded in place through one scratch
+        # buffer (slight detune on the frequency)
+        scratch = numpy.multiply(t, 0.5, out=numpy.empty_like(t))
+        numpy.sin(scratch, out=scratch)
+        scratch *= 0.1
+        scratch += 1
+        scratch *= 110  # Detuned bass frequency
+        scratch *= t
+        scratch *= 2 * numpy.pi
+        audio = numpy.sin(scratch)
+        audio *= 0.25
+
+        # Add arpeggios: gather the per-sample note frequency with one
+        # indexed load instead of a 2.6M-iteration Python loop
+        arp_notes = numpy.array([220, 277, 330, 440], dtype=numpy.float32)  # A3, C#4, E4, A4
+        note_idx = (t * 4).astype(numpy.intp) % arp_notes.size
+        numpy.multiply(arp_notes[note_idx], t, out=scratch)
+        scratch *= 2 * numpy.pi
+        numpy.sin(scratch, out=scratch)
+        scratch *= 0.15
+        audio += scratch
+
+        audio *= 0.8
+
+        # Add glitch effects: only ~1% of samples are hit, so draw just
+        # the affected indices instead of masking two full-size arrays
+        rng = numpy.random.default_rng()
+        n_glitches = rng.binomial(len(t), 0.01)  # 1% chance of glitch
+        if n_glitches:
+            idx = rng.integers(0, len(t), n_glitches)
+            audio[idx] += 0.3 * rng.uniform(-0.1, 0.1, n_glitches).astype(numpy.float32)
+
+        numpy.clip(audio, -0.99, 0.99, out=audio)
+
+        sound = _make_sound(_to_stereo_int16(audio))
         sound.set_volume(0.6)
         return sound
 
@@ -362,25 +578,35 @@ class SoundManager:
         sample_rate = 44100
         duration = 45  # seconds
         n_samples = int(sample_rate * duration)
-        t = numpy.linspace(0, duration, n_samples, False)
-
-        # Create a drone
-        drone = 0.1 * numpy.sin(2 * numpy.pi * 73.42 * t)  # D#2
-        drone += 0.08 * numpy.sin(2 * numpy.pi * 110 * t)  # A2
-
-        # Add random plucks
-        pluck_env = numpy.exp(-5 * (t % 1.0))  # Exponential decay for plucks
-        pluck = 0.15 * pluck_env * numpy.sin(2 * numpy.pi * 440 * t)
+        t = numpy.linspace(0, duration, n_samples, False, dtype=numpy.float32)
+
+        # Create a drone, accumulated through one scratch buffer
+        scratch = numpy.multiply(t, 2 * numpy.pi * 73.42, out=numpy.empty_like(t))
+        audio = numpy.sin(scratch)  # D#2
+        audio *= 0.1
+        numpy.multiply(t, 2 * numpy.pi * 110, out=scratch)  # A2
+        numpy.sin(scratch, out=scratch)
+        scratch *= 0.08
+        audio += scratch
+
+        # Add random plucks (exponential decay envelope)
+        numpy.mod(t, 1.0, out=scratch)
+        scratch *= -5
+        numpy.exp(scratch, out=scratch)
+        scratch *= 0.15
+        scratch *= numpy.sin(2 * numpy.pi * 440 * t)
+        audio += scratch
 
         # Add noise for tension
-        noise = 0.05 * numpy.random.uniform(-1, 1, len(t))
+        rng = numpy.random.default_rng()
+        noise = 0.05 * rng.uniform(-1, 1, len(t)).astype(numpy.float32)
+        audio += noise
 
         # Combine and normalize
-        audio = 0.7 * (drone + pluck + noise)
-        audio = numpy.clip(audio, -0.99, 0.99)
-        stereo = numpy.column_stack((audio, audio))
+        audio *= 0.7
+        numpy.clip(audio, -0.99, 0.99, out=audio)
 
-        sound = pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        sound = _make_sound(_to_stereo_int16(audio))
         sound.set_volume(0.5)
         return sound
 
@@ -389,36 +615,38 @@ class SoundManager:
         sample_rate = 44100
         duration = 5  # seconds
         n_samples = int(sample_rate * duration)
-        t = numpy.linspace(0, duration, n_samples, False)
+        t = numpy.linspace(0, duration, n_samples, False, dtype=numpy.float32)
 
-        # Create a rising arpeggio
-        notes = [523.25, 659.25, 783.99, 1046.50]  # C5, E5, G5, C6
+        # Create a rising arpeggio: the notes occupy equal back-to-back
+        # segments, so generate them as one (note, segment) batch
+        notes = numpy.array([523.25, 659.25, 783.99, 1046.50], dtype=numpy.float32)  # C5, E5, G5, C6
         audio = numpy.zeros_like(t)
 
-        for i, note in enumerate(notes):
-            start = int(i * 0.2 * sample_rate)
-            end = int((i + 1) * 0.2 * sample_rate)
-            if end > len(audio):
-                break
-            env = numpy.linspace(1, 0, end - start) ** 2  # Decaying envelope
-            audio[start:end] += (
-                0.3 * env * numpy.sin(2 * numpy.pi * note * t[start:end])
-            )
-
-        # Add some sparkle
-        sparkle = numpy.random.uniform(-0.1, 0.1, len(t))
-        sparkle_mask = numpy.random.random(len(t)) > 0.95  # 5% chance of sparkle
-        audio += 0.5 * sparkle * sparkle_mask
+        seg = int(0.2 * sample_rate)
+        n_notes = min(notes.size, len(audio) // seg)
+        if n_notes:
+            env = numpy.linspace(1, 0, seg, dtype=numpy.float32) ** 2  # Decaying envelope
+            seg_t = t[: n_notes * seg].reshape(n_notes, seg)
+            audio[: n_notes * seg] = (
+                0.3 * env * numpy.sin(2 * numpy.pi * notes[:n_notes, None] * seg_t)
+            ).ravel()
+
+        # Add some sparkle: only ~5% of samples are hit, so draw just the
+        # affected indices instead of masking two full-size arrays
+        rng = numpy.random.default_rng()
+        n_sparkles = rng.binomial(len(t), 0.05)  # 5% chance of sparkle
+        if n_sparkles:
+            idx = rng.integers(0, len(t), n_sparkles)
+            audio[idx] += 0.5 * rng.uniform(-0.1, 0.1, n_sparkles).astype(numpy.float32)
 
         # Apply a fade out
-        fade_out = numpy.linspace(1, 0, int(0.5 * sample_rate))  # 0.5s fade out
+        fade_out = numpy.linspace(1, 0, int(0.5 * sample_rate), dtype=numpy.float32)  # 0.5s fade out
         if len(fade_out) < len(audio):
             audio[-len(fade_out) :] *= fade_out
 
-        audio = numpy.clip(audio, -0.99, 0.99)
-        stereo = numpy.column_stack((audio, audio))
+        numpy.clip(audio, -0.99, 0.99, out=audio)
 
-        sound = pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        sound = _make_sound(_to_stereo_int16(audio))
         sound.set_volume(0.7)
         return sound
 
@@ -426,7 +654,7 @@ class SoundManager:
         """Create server room ambient sound"""
         sample_rate = 44100
         n_samples = int(sample_rate * duration_ms / 1000)
-        t = numpy.linspace(0, duration_ms / 1000, n_samples, False)
+        t = numpy.linspace(0, duration_ms / 1000, n_samples, False, dtype=numpy.float32)
 
         # Add some low-frequency hum for server room ambience
         hum = 0.02 * numpy.sin(2 * numpy.pi * 60 * t)  # 60Hz hum
@@ -437,28 +665,33 @@ class SoundManager:
             fan_env * 0.01 * numpy.sin(2 * numpy.pi * 120 * t)
         )  # Clean 120Hz fan sound
 
-        # Add occasional disk activity
-        disk = numpy.zeros(n_samples)
-        disk_times = numpy.random.poisson(5, size=100) * 0.1  # Random disk activity
-        for time in numpy.cumsum(disk_times):
-            if time * sample_rate < n_samples:
-                start = int(time * sample_rate)
-                end = min(start + 100, n_samples)
-                # Subtle, clean disk activity
-                disk[start:end] = 0.02 * numpy.sin(
-                    2 * numpy.pi * 800 * numpy.linspace(0, 0.1, end - start)
-                )
+        # Add occasional disk activity: every burst is the same subtle
+        # 100-sample chirp, scattered in one fancy-indexed assignment
+        disk = numpy.zeros(n_samples, dtype=numpy.float32)
+        rng = numpy.random.default_rng()
+        disk_times = rng.poisson(5, size=100) * 0.1  # Random disk activity
+        starts = (numpy.cumsum(disk_times) * sample_rate).astype(numpy.intp)
+        starts = starts[starts < n_samples]
+        if starts.size:
+            burst = 0.02 * numpy.sin(
+                2 * numpy.pi * 800 * numpy.linspace(0, 0.1, 100, dtype=numpy.float32)
+            )
+            idx = starts[:, None] + numpy.arange(100)
+            in_range = idx < n_samples
+            disk[idx[in_range]] = numpy.broadcast_to(burst, idx.shape)[in_range]
 
         # Combine all layers with reduced overall volume
         audio = 0.5 * (hum + fan + disk)
         audio = numpy.clip(audio, -0.99, 0.99)
 
         # Convert to stereo with slight variation between channels
-        left = audio * 0.9 + 0.1 * numpy.random.uniform(-1, 1, n_samples)
-        right = audio * 0.9 + 0.1 * numpy.random.uniform(-1, 1, n_samples)
-        stereo = numpy.column_stack((left, right))
+        left = audio * 0.9 + 0.1 * rng.uniform(-1, 1, n_samples).astype(numpy.float32)
+        right = audio * 0.9 + 0.1 * rng.uniform(-1, 1, n_samples).astype(numpy.float32)
+        stereo = numpy.empty((n_samples, 2), dtype=numpy.int16)
+        numpy.multiply(left, 32767, out=stereo[:, 0], casting="unsafe")
+        numpy.multiply(right, 32767, out=stereo[:, 1], casting="unsafe")
 
-        return pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        return _make_sound(stereo)
 
     def _create_success_sound(self) -> pygame.mixer.Sound:
         """Create a success confirmation sound"""
@@ -467,7 +700,7 @@ class SoundManager:
         n_samples = int(sample_rate * duration)
 
         # Create a rising tone for success
-        t = numpy.linspace(0, duration, n_samples, False)
+        t = numpy.linspace(0, duration, n_samples, False, dtype=numpy.float32)
         tone1 = 0.2 * numpy.sin(2 * numpy.pi * 880 * t)  # A5
         tone2 = 0.15 * numpy.sin(2 * numpy.pi * 1318.51 * t)  # E6
 
@@ -475,7 +708,7 @@ class SoundManager:
         attack = int(0.1 * sample_rate)  # 100ms attack
         release = int(0.3 * sample_rate)  # 300ms release
 
-        envelope = numpy.ones(n_samples)
+        envelope = numpy.ones(n_samples, dtype=numpy.float32)
         if attack > 0:
             envelope[:attack] = numpy.linspace(0, 1, attack)
         if release > 0:
@@ -485,9 +718,8 @@ class SoundManager:
         audio = (tone1 + tone2) * envelope
         audio = numpy.clip(audio, -0.99, 0.99)
 
-        # Create stereo sound
-        stereo = numpy.column_stack((audio, audio * 0.95))  # Slight stereo variation
-        sound = pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        # Create stereo sound with slight right-channel variation
+        sound = _make_sound(_to_stereo_int16(audio, right_gain=0.95))
         sound.set_volume(0.5)  # Reasonable volume level
         return sound
 
@@ -498,7 +730,7 @@ class SoundManager:
         n_samples = int(sample_rate * duration)
 
         # Create a falling tone for failure
-        t = numpy.linspace(0, duration, n_samples, False)
+        t = numpy.linspace(0, duration, n_samples, False, dtype=numpy.float32)
         tone = 0.3 * numpy.sin(
             2 * numpy.pi * 440 * (1 - 0.5 * t / duration) * t
         )  # Falling pitch
@@ -507,7 +739,7 @@ class SoundManager:
         attack = int(0.05 * sample_rate)  # 50ms attack
         release = int(0.4 * sample_rate)  # 400ms release
 
-        envelope = numpy.ones(n_samples)
+        envelope = numpy.ones(n_samples, dtype=numpy.float32)
         if attack > 0:
             envelope[:attack] = numpy.linspace(0, 1, attack)
         if release > 0:
@@ -515,12 +747,12 @@ class SoundManager:
 
         # Apply envelope and add some noise
         audio = tone * envelope
-        noise = 0.1 * (numpy.random.random(n_samples) * 2 - 1)  # Add some noise
+        rng = numpy.random.default_rng()
+        noise = 0.1 * (rng.random(n_samples, dtype=numpy.float32) * 2 - 1)  # Add some noise
         audio = numpy.clip(audio + noise, -0.99, 0.99)
 
-        # Create stereo sound
-        stereo = numpy.column_stack((audio, audio * 0.9))  # Slight stereo variation
-        sound = pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        # Create stereo sound with slight right-channel variation
+        sound = _make_sound(_to_stereo_int16(audio, right_gain=0.9))
         sound.set_volume(0.4)  # Slightly lower volume for error sounds
         return sound
 
@@ -535,67 +767,57 @@ class SoundManager:
             return pygame.mixer.Sound(buffer=bytes([0, 0, 0, 0]))
 
         # Create an array to hold the audio data
-        audio = numpy.zeros(n_samples)
+        audio = numpy.zeros(n_samples, dtype=numpy.float32)
 
         # Limit the number of key presses to prevent too many sounds
-        max_key_presses = min(
+        n_keys = min(
             100, n_samples // 100
         )  # At most 100 key presses or 1 per 100 samples
 
-        # Create key press events with varying speeds and patterns
-        for _ in range(max_key_presses):
-            # Random position for the key press
-            pos = random.randint(
-                0, max(1, n_samples - 1000)
-            )  # Leave room for the key press
-
-            # Random key press length (3-10ms)
-            press_len = min(
-                1000, max(100, random.randint(130, 400))
-            )  # Ensure reasonable bounds
-
-            # Ensure we don't go out of bounds
-            press_len = min(press_len, n_samples - pos)
-            if press_len <= 0:
-                continue
-
-            # Random frequency for this key (higher frequencies for higher keys)
-            freq = random.uniform(100, 1000)
-
-            # Create a short tone for the key press
-            t = numpy.linspace(0, press_len / 1000, press_len, False)
-            tone = 0.15 * numpy.sin(2 * numpy.pi * freq * t)  # Reduced volume
-
-            # Apply an envelope (quick attack, quick release)
-            attack = max(1, int(press_len * 0.2))
-            release = max(1, int(press_len * 0.3))
-
-            # Ensure attack + release doesn't exceed press_len
-            if attack + release > press_len:
-                attack = release = max(1, press_len // 2)
-
-            envelope = numpy.ones(press_len)
-            if attack > 0 and attack < press_len:
-                envelope[:attack] = numpy.linspace(0, 1, attack)
-            if release > 0 and release < press_len:
-                envelope[-release:] = numpy.linspace(1, 0, release)
-
-                # Add some randomness to the volume
-                volume = random.uniform(0.1, 0.3)
+        # Generate every key press as one (key, sample) batch: random
+        # positions/lengths/frequencies as arrays, one sin call for all
+        # tones, a vectorized trapezoidal envelope, and a single
+        # scatter-add into the output buffer
+        rng = numpy.random.default_rng()
+        if n_keys:
+            pos = rng.integers(0, max(1, n_samples - 1000) + 1, n_keys)
+            lengths = rng.integers(130, 401, n_keys)  # Key press length
+            lengths = numpy.minimum(lengths, n_samples - pos)
+
+            # Random frequency per key (higher frequencies for higher keys)
+            freqs = rng.uniform(100, 1000, n_keys).astype(numpy.float32)
+            volumes = rng.uniform(0.1, 0.3, n_keys).astype(numpy.float32)
+
+            max_len = int(lengths.max())
+            j = numpy.arange(max_len, dtype=numpy.float32)
+            tones = 0.15 * numpy.sin(
+                2 * numpy.pi * freqs[:, None] * (j / 1000)
+            )  # Reduced volume
+
+            # Envelope (quick attack, quick release): ramp up over the
+            # attack, hold at 1, ramp down over the release
+            attack = numpy.maximum(1, (lengths * 0.2).astype(numpy.intp))[:, None]
+            release = numpy.maximum(1, (lengths * 0.3).astype(numpy.intp))[:, None]
+            length_col = lengths[:, None]
+            envelope = numpy.minimum(
+                numpy.clip(j / numpy.maximum(attack - 1, 1), 0, 1),
+                numpy.clip((length_col - 1 - j) / numpy.maximum(release - 1, 1), 0, 1),
+            )
 
-                # Add the key press to the audio
-                end = min(pos + press_len, n_samples)
-                audio[pos:end] += (tone * envelope * volume)[: end - pos]
+            idx = pos[:, None] + numpy.arange(max_len)
+            in_press = j < length_col
+            numpy.add.at(
+                audio, idx[in_press], (tones * envelope * volumes[:, None])[in_press]
+            )
 
         # Add some subtle background noise
-        noise = numpy.random.uniform(-0.02, 0.02, n_samples)
+        noise = rng.uniform(-0.02, 0.02, n_samples).astype(numpy.float32)
         audio = audio * 0.8 + noise * 0.2
 
-        # Normalize and convert to stereo
-        audio = numpy.clip(audio, -0.99, 0.99)
-        stereo = numpy.column_stack((audio, audio * 0.9))  # Slight stereo variation
+        # Normalize and convert to stereo with slight right-channel variation
+        numpy.clip(audio, -0.99, 0.99, out=audio)
 
-        return pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        return _make_sound(_to_stereo_int16(audio, right_gain=0.9))
 
     def _create_typing_sound(self, duration_ms: int = 5000) -> pygame.mixer.Sound:
         """Create a typing sound effect (alias for backward compatibility)"""
@@ -607,7 +829,8 @@ class SoundManager:
         n_samples = int(sample_rate * duration_ms / 1000)
 
         # Create noise with some filtering
-        noise = numpy.random.uniform(-1, 1, n_samples)
+        rng = numpy.random.default_rng()
+        noise = rng.uniform(-1, 1, n_samples).astype(numpy.float32)
 
         # Apply a filter to make it more like radio static
         for i in range(2, n_samples):
@@ -615,14 +838,13 @@ class SoundManager:
 
         # Add some variation in volume
         env = 0.5 * (
-            1 + numpy.sin(2 * numpy.pi * 0.5 * numpy.linspace(0, 1, n_samples))
+            1 + numpy.sin(2 * numpy.pi * 0.5 * numpy.linspace(0, 1, n_samples, dtype=numpy.float32))
         )
         noise *= env
 
-        noise = numpy.clip(noise, -0.99, 0.99)
-        stereo = numpy.column_stack((noise, noise * 0.95))  # Slight stereo variation
+        numpy.clip(noise, -0.99, 0.99, out=noise)
 
-        return pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        return _make_sound(_to_stereo_int16(noise, right_gain=0.95))
         duration = 0.8  # seconds
         n_samples = int(sample_rate * duration)
         t = numpy.linspace(0, duration, n_samples, False)
@@ -658,7 +880,7 @@ class SoundManager:
         # Convert to stereo with slight variation
         stereo = numpy.column_stack((audio, audio * 0.9))
 
-        sound = pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        sound = _make_sound((stereo * 32767).astype(numpy.int16))
         sound.set_volume(0.65)
         return sound
 
@@ -667,18 +889,18 @@ class SoundManager:
         sample_rate = 44100
         duration = 0.3  # seconds
         n_samples = int(sample_rate * duration)
-        t = numpy.linspace(0, duration, n_samples, False)
+        t = numpy.linspace(0, duration, n_samples, False, dtype=numpy.float32)
 
         # Create a harsh beep with a falling pitch
         start_freq = 880  # A5
         end_freq = 220  # A3
-        freq = numpy.linspace(start_freq, end_freq, n_samples)
+        freq = numpy.linspace(start_freq, end_freq, n_samples, dtype=numpy.float32)
 
         # Create amplitude envelope (quick attack, slow release)
         attack = int(0.05 * sample_rate)  # 50ms attack
         release = int(0.15 * sample_rate)  # 150ms release
 
-        envelope = numpy.ones(n_samples)
+        envelope = numpy.ones(n_samples, dtype=numpy.float32)
         if attack > 0:
             envelope[:attack] = numpy.linspace(0, 1, attack)
         if release > 0:
@@ -688,10 +910,8 @@ class SoundManager:
         audio = 0.4 * numpy.sin(2 * numpy.pi * freq * t) * envelope
         audio = numpy.clip(audio, -0.99, 0.99)
 
-        # Convert to stereo
-        stereo = numpy.column_stack((audio, audio * 0.9))  # Slight stereo variation
-
-        sound = pygame.sndarray.make_sound((stereo * 32767).astype(numpy.int16))
+        # Convert to stereo with slight right-channel variation
+        sound = _make_sound(_to_stereo_int16(audio, right_gain=0.9))
         sound.set_volume(0.7)
         return sound
 
@@ -700,18 +920,8 @@ class SoundManager:
         sample_rate = 44100
         n_samples = int(sample_rate * duration / 1000.0)
 
-        # Create a numpy array for the sound
-        t = numpy.linspace(0, duration / 1000.0, n_samples, False)
-        tone = numpy.sin(2 * numpy.pi * frequency * t) * 0.5
-
-        # Convert to 16-bit data
-        audio = numpy.array([(tone * 32767).astype(numpy.int16)]).T
-
-        # Convert to stereo
-        stereo = numpy.column_stack((audio, audio))
-
-        # Create sound from numpy array
-        return pygame.sndarray.make_sound(stereo.astype(numpy.int16))
+        # Create sound from the shared synthesis pipeline
+        return _make_sound(_synth_sine(n_samples, frequency, sample_rate))
 
     def _create_glitch(self, duration=1000):
         """Create a glitchy sound effect using numpy for better performance"""
@@ -723,18 +933,20 @@ class SoundManager:
             samples = numpy.zeros(n_samples, dtype=numpy.int16)
 
             # Add random glitches
-            glitch_indices = numpy.random.randint(
+            rng = numpy.random.default_rng()
+            glitch_indices = rng.integers(
                 0, n_samples, size=n_samples // 10
             )  # 10% glitch density
-            samples[glitch_indices] = numpy.random.randint(
+            samples[glitch_indices] = rng.integers(
                 -32767, 32767, size=len(glitch_indices), dtype=numpy.int16
             )
 
-            # Convert to stereo
-            stereo = numpy.column_stack((samples, samples))
-
-            # Create the sound
-            sound = pygame.sndarray.make_sound(stereo.astype(numpy.int16))
+            # Broadcast the mono buffer across both channels; only the
+            # final contiguous copy materializes the second column
+            stereo = numpy.ascontiguousarray(
+                numpy.broadcast_to(samples[:, None], (n_samples, 2))
+            )
+            sound = _make_sound(stereo)
             sound.set_volume(0.3)
             return sound
         except Exception as e:
@@ -749,25 +961,29 @@ class SoundManager:
         n_samples = int(sample_rate * duration / 1000)
 
         # Create time array
-        t = numpy.linspace(0, duration / 1000.0, n_samples, False)
-
-        # Create rising frequency (200Hz to 1000Hz)
-        freq = 200 + (t / (duration / 1000.0)) * 800
+        t = numpy.linspace(0, duration / 1000.0, n_samples, False, dtype=numpy.float32)
 
-        # Generate the base tone
-        tone = numpy.sin(2 * numpy.pi * freq * t) * 0.3
+        # Rising frequency (200Hz to 1000Hz), folded into the phase in
+        # place: one scratch buffer instead of a temporary per step
+        phase = numpy.multiply(t, 800 / (duration / 1000.0))
+        phase += 200
+        phase *= t
+        phase *= 2 * numpy.pi
+        tone = numpy.sin(phase, out=phase)
+        tone *= 0.3
 
         # Add some noise (10% of samples get random noise)
-        noise_mask = numpy.random.random(n_samples) < 0.1
-        noise = numpy.random.uniform(-0.1, 0.1, n_samples) * noise_mask
-        tone = numpy.clip(tone + noise, -1.0, 1.0)
-
-        # Convert to 16-bit data and stereo
-        audio = (tone * 32767).astype(numpy.int16)
-        stereo = numpy.column_stack((audio, audio))
-
-        # Create and return the sound
-        return pygame.sndarray.make_sound(stereo.astype(numpy.int16)).set_volume(0.3)
+        rng = numpy.random.default_rng()
+        noise_mask = rng.random(n_samples) < 0.1
+        noise = rng.uniform(-0.1, 0.1, n_samples).astype(numpy.float32) * noise_mask
+        tone += noise
+        numpy.clip(tone, -1.0, 1.0, out=tone)
+
+        # Create and return the sound (set_volume returns None, so it
+        # must not be chained onto the return)
+        sound = _make_sound(_to_stereo_int16(tone))
+        sound.set_volume(0.3)
+        return sound
 
     def _create_decrypt_sound(self):
         """Create a decryption sound effect using numpy for better performance"""
@@ -776,23 +992,27 @@ class SoundManager:
         n_samples = int(sample_rate * duration / 1000)
 
         # Create time array
-        t = numpy.linspace(0, duration / 1000.0, n_samples, False)
-
-        # Create a sweeping frequency (100Hz to 1100Hz and back)
-        progress = numpy.linspace(0, 1, n_samples)
-        freq = 100 + numpy.sin(progress * numpy.pi) * 1000
-
-        # Generate the base tone
-        tone = numpy.sin(2 * numpy.pi * freq * t) * 0.4
+        t = numpy.linspace(0, duration / 1000.0, n_samples, False, dtype=numpy.float32)
+
+        # Sweeping frequency (100Hz to 1100Hz and back), computed in
+        # place: the progress buffer becomes the frequency, then the phase
+        phase = numpy.linspace(0, numpy.pi, n_samples, dtype=numpy.float32)
+        numpy.sin(phase, out=phase)
+        phase *= 1000
+        phase += 100
+        phase *= t
+        phase *= 2 * numpy.pi
+        tone = numpy.sin(phase, out=phase)
+        tone *= 0.4
 
         # Add some digital noise (5% of samples get random values)
-        noise_mask = numpy.random.random(n_samples) < 0.05
-        noise = numpy.random.uniform(-1.0, 1.0, n_samples) * noise_mask
-        tone = numpy.where(noise_mask, noise, tone)
-
-        # Convert to 16-bit data and stereo
-        audio = (tone * 32767).astype(numpy.int16)
-        stereo = numpy.column_stack((audio, audio))
-
-        # Create and return the sound
-        return pygame.sndarray.make_sound(stereo.astype(numpy.int16)).set_volume(0.3)
+        rng = numpy.random.default_rng()
+        noise_mask = rng.random(n_samples) < 0.05
+        noise = rng.uniform(-1.0, 1.0, n_samples).astype(numpy.float32) * noise_mask
+        numpy.copyto(tone, noise, where=noise_mask)
+
+        # Create and return the sound (set_volume returns None, so it
+        # must not be chained onto the return)
+        sound = _make_sound(_to_stereo_int16(tone))
+        sound.set_volume(0.3)
+        return sound